@@ -0,0 +1 @@
+"""Код окон, общий для нескольких лабораторных работ"""
@@ -0,0 +1,135 @@
+"""Панель фонового вычисления для окон лабораторных работ"""
+
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import tkinter as tk
+from tkinter import ttk
+from tkinter import messagebox
+
+
+class TaskPanel(ttk.Frame):
+    """Индикатор выполнения и кнопка отмены для вычислений в фоновом потоке.
+
+    Рабочая функция получает progress(value, maximum): он запоминает ход вычисления
+    и выбрасывает cancelled (SolverCancelled из core лабораторной), если пользователь
+    нажал «Отмена». Tk опрашивает состояние через after, поэтому окно не блокируется.
+    Промежуточные данные рабочая функция передает через publish, они приходят
+    в on_update пачками при опросе.
+    """
+    # Все созданные панели: при закрытии окна их вычисления отменяются
+    panels = weakref.WeakSet()
+
+    def __init__(self, parent, cancelled, poll_ms=50):
+        super().__init__(parent)
+        self.cancelled = cancelled
+        self.poll_ms = poll_ms
+        # у каждой панели свой поток: одновременно она ведет одно вычисление
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.future = None
+        self.cancel_event = threading.Event()
+        self.state = (0, None)
+        self.updates = deque()
+        self.on_update = None
+        TaskPanel.panels.add(self)
+
+        self.progressbar = ttk.Progressbar(self, length=150, mode='determinate')
+        self.progressbar.pack(side=tk.LEFT, padx=5)
+        self.cancel_btn = ttk.Button(self, text="Отмена", command=self.cancel, state=tk.DISABLED)
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
+        self.status_label = ttk.Label(self, text="")
+        self.status_label.pack(side=tk.LEFT, padx=5)
+
+    def run(self, work, on_done, on_error=None, on_update=None):
+        """Запускает work(progress) в фоне; on_done(result) и on_update(список данных)
+        вызываются в потоке Tk. Возвращает False, если предыдущее вычисление не закончено"""
+        if self.future is not None:
+            self.status_label.config(text="Дождитесь окончания вычисления")
+            return False
+
+        self.cancel_event = threading.Event()
+        self.state = (0, None)
+        self.updates = deque()
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_update = on_update
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.status_label.config(text="Выполняется...")
+        self.future = self.executor.submit(work, self.progress)
+        self.after(self.poll_ms, self.poll)
+        return True
+
+    def publish(self, item):
+        # Вызывается из рабочего потока; Tk забирает накопленное при опросе
+        self.updates.append(item)
+
+    def flush_updates(self):
+        items = []
+        while self.updates:
+            items.append(self.updates.popleft())
+        if items and self.on_update:
+            self.on_update(items)
+
+    def progress(self, value, maximum):
+        # Вызывается из рабочего потока между итерациями
+        if self.cancel_event.is_set():
+            raise self.cancelled()
+        self.state = (value, maximum)
+
+    def cancel(self):
+        self.cancel_event.set()
+        self.status_label.config(text="Отмена...")
+
+    def shutdown(self):
+        """Отменяет текущее вычисление и останавливает поток панели, не дожидаясь его:
+        вычисление прервется на ближайшем вызове progress"""
+        self.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def poll(self):
+        value, maximum = self.state
+        if maximum:
+            self.progressbar.config(mode='determinate', maximum=maximum, value=min(value, maximum))
+        else:
+            self.progressbar.config(mode='indeterminate')
+            self.progressbar.step(5)
+
+        # Готовность проверяется до выборки данных, чтобы последние записи не потерялись
+        finished = self.future.done()
+        self.flush_updates()
+        if not finished:
+            self.after(self.poll_ms, self.poll)
+            return
+
+        future, self.future = self.future, None
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.progressbar.config(mode='determinate', maximum=1, value=0)
+
+        try:
+            result = future.result()
+        except self.cancelled:
+            self.status_label.config(text="Отменено")
+            return
+        except Exception as e:
+            self.status_label.config(text="")
+            if self.on_error:
+                self.on_error(e)
+            else:
+                messagebox.showerror("Ошибка", str(e))
+            return
+
+        self.progressbar.config(value=1)
+        self.status_label.config(text="Готово")
+        self.on_done(result)
+
+
+def close_on_delete(root):
+    """Закрытие окна отменяет вычисления всех панелей и не ждет их окончания"""
+    def close():
+        for panel in list(TaskPanel.panels):
+            panel.shutdown()
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", close)
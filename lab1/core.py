@@ -0,0 +1,310 @@
+"""Вычислительная часть: разбор формул, построение выборок и загрузка таблиц (без tkinter и matplotlib)"""
+
+import os
+import csv
+import ast
+import hashlib
+from functools import lru_cache
+from itertools import islice
+
+import numpy as np
+
+
+# Каталог кэша разобранных табличных файлов
+TABLE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'vichmath')
+
+# Имена, доступные в формулах
+FORMULA_NAMESPACE = {
+    'np': np,
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'exp': np.exp,
+    'log': np.log,
+    'sqrt': np.sqrt,
+    'abs': np.abs,
+    'pi': np.pi,
+    'e': np.e,
+    'pow': np.power
+}
+
+# Разрешенные узлы синтаксического дерева формулы
+ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.Attribute,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv,
+    ast.UAdd, ast.USub,
+)
+
+
+@lru_cache(maxsize=128)
+def compile_formula(formula):
+    """Разбирает формулу один раз и компилирует ее в функцию f(x)"""
+    try:
+        tree = ast.parse(formula, mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Синтаксическая ошибка в формуле: {e.msg}")
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_NODES):
+            raise ValueError(f"Недопустимая конструкция в формуле: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id != 'x' and node.id not in FORMULA_NAMESPACE:
+            raise ValueError(f"Неизвестное имя в формуле: {node.id}")
+        if isinstance(node, ast.Attribute):
+            if not (isinstance(node.value, ast.Name) and node.value.id == 'np') or node.attr.startswith('_'):
+                raise ValueError(f"Недопустимое обращение к атрибуту: {node.attr}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"Недопустимая константа в формуле: {node.value!r}")
+
+    # Оборачиваем выражение в lambda x: ..., чтобы x передавался аргументом
+    func_tree = ast.Expression(body=ast.Lambda(
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(arg='x')], kwonlyargs=[],
+                           kw_defaults=[], defaults=[]),
+        body=tree.body,
+    ))
+    ast.fix_missing_locations(func_tree)
+    code = compile(func_tree, '<formula>', 'eval')
+    return eval(code, {'__builtins__': {}, **FORMULA_NAMESPACE})
+
+
+def sample_function(formula, x_vals):
+    """Вычисляет формулу на всей сетке за один вызов, ошибки и бесконечности заменяются на NaN"""
+    x_vals = np.asarray(x_vals, dtype=float)
+    func = compile_formula(formula)
+
+    with np.errstate(all='ignore'):
+        try:
+            y_vals = np.asarray(func(x_vals), dtype=float)
+        except (ArithmeticError, TypeError, ValueError):
+            # Формула не векторизуется — считаем по точкам
+            y_vals = np.array([_evaluate_point(func, x) for x in x_vals], dtype=float)
+
+    y_vals = np.array(np.broadcast_to(y_vals, x_vals.shape), dtype=float)
+    y_vals[~np.isfinite(y_vals)] = np.nan
+    return y_vals
+
+
+def _evaluate_point(func, x):
+    try:
+        return float(func(x))
+    except (ArithmeticError, TypeError, ValueError):
+        return np.nan
+
+
+def adaptive_sample(formula, x_min, x_max, width_px=800, height_px=600,
+                    pixel_tol=0.5, max_evals=20000, initial_points=65):
+    """Адаптивная выборка точек графика: сгущает сетку там, где кривая изгибается или скачет.
+
+    Возвращает массивы x, y; в местах разрывов вставлены NaN, чтобы линия не соединялась.
+    """
+    x_vals = np.linspace(x_min, x_max, initial_points)
+    y_vals = sample_function(formula, x_vals)
+    evaluations = initial_points
+
+    # Масштаб экрана: пикселей на единицу по x и по y (по устойчивому размаху значений)
+    x_scale = width_px / (x_max - x_min)
+    finite = y_vals[np.isfinite(y_vals)]
+    if finite.size:
+        y_low, y_high = np.percentile(finite, [5, 95])
+    else:
+        y_low, y_high = 0.0, 1.0
+    y_scale = height_px / (y_high - y_low if y_high > y_low else 1.0)
+    min_width = 0.01 / x_scale
+
+    # Индексы отрезков [x[i], x[i+1]], которые нужно проверить
+    active = np.arange(len(x_vals) - 1)
+
+    while active.size and evaluations < max_evals:
+        active = active[(x_vals[active + 1] - x_vals[active]) > min_width]
+        if active.size > max_evals - evaluations:
+            active = active[:max_evals - evaluations]
+        if not active.size:
+            break
+
+        x_left, x_right = x_vals[active], x_vals[active + 1]
+        y_left, y_right = y_vals[active], y_vals[active + 1]
+        x_mid = (x_left + x_right) / 2
+        y_mid = sample_function(formula, x_mid)
+        evaluations += active.size
+
+        # Отклонение середины от хорды в пикселях; NaN на одном из концов — граница области определения
+        deviation = np.abs(y_mid - (y_left + y_right) / 2) * y_scale
+        nan_count = np.isnan(y_left).astype(int) + np.isnan(y_mid) + np.isnan(y_right)
+        refine = (deviation > pixel_tol) | ((nan_count > 0) & (nan_count < 3))
+
+        x_vals = np.insert(x_vals, active + 1, x_mid)
+        y_vals = np.insert(y_vals, active + 1, y_mid)
+
+        # После вставки k-й середины отрезок active[k] распался на два с индексами active[k] + k и +1
+        shifted = active[refine] + np.flatnonzero(refine)
+        active = np.concatenate([shifted, shifted + 1])
+        active.sort()
+
+    # Разрыв: скачок больше половины высоты экрана на отрезке, который не удалось сгладить,
+    # причем направление скачка расходится с обоими соседями (полюс или ступенька, а не крутой склон)
+    steps = np.diff(y_vals)
+    widths = np.diff(x_vals)
+    unresolved = np.zeros(len(widths), dtype=bool)
+    unresolved[active] = True
+    direction = np.sign(steps)
+    previous = np.concatenate([[np.nan], direction[:-1]])
+    following = np.concatenate([direction[1:], [np.nan]])
+    breaks = np.flatnonzero(
+        (np.abs(steps) * y_scale > height_px / 2)
+        & ((widths <= 2 * min_width) | unresolved)
+        & (direction != previous) & (direction != following)
+    )
+
+    x_vals = np.insert(x_vals, breaks + 1, (x_vals[breaks] + x_vals[breaks + 1]) / 2)
+    y_vals = np.insert(y_vals, breaks + 1, np.nan)
+    return x_vals, y_vals
+
+
+def minmax_decimate(x_vals, y_vals, buckets):
+    """Прореживание min/max: в каждой корзине остаются точки минимума и максимума (в порядке следования)"""
+    n = len(x_vals)
+    if n <= 2 * buckets:
+        return x_vals, y_vals
+
+    size = -(-n // buckets)
+    count = n // size
+    blocks = y_vals[:count * size].reshape(count, size)
+    offsets = np.arange(count) * size
+    idx_min = np.argmin(np.where(np.isnan(blocks), np.inf, blocks), axis=1) + offsets
+    idx_max = np.argmax(np.where(np.isnan(blocks), -np.inf, blocks), axis=1) + offsets
+
+    indices = [[0], np.minimum(idx_min, idx_max), np.maximum(idx_min, idx_max)]
+    if count * size < n:
+        tail = y_vals[count * size:]
+        if not np.all(np.isnan(tail)):
+            indices.append(count * size + np.array([np.nanargmin(tail), np.nanargmax(tail)]))
+    indices.append([n - 1])
+
+    indices = np.unique(np.concatenate(indices))
+    return x_vals[indices], y_vals[indices]
+
+
+def load_table(file_path, columns=(0, 1), header=False, chunk_rows=100_000):
+    """Читает CSV частями сразу в массивы float64 (по 16 байт на пару x, y)"""
+    columns = tuple(columns)
+    capacity = 0
+    x_vals = np.empty(0)
+    y_vals = np.empty(0)
+    count = 0
+    line_num = 0
+
+    with open(file_path, 'r', newline='') as f:
+        if header:
+            f.readline()
+            line_num = 1
+
+        while True:
+            lines = list(islice(f, chunk_rows))
+            if not lines:
+                break
+
+            try:
+                block = np.loadtxt(lines, delimiter=',', usecols=columns, ndmin=2,
+                                   comments=None, quotechar='"', dtype=np.float64)
+            except ValueError:
+                # Построчно ищем первую плохую строку, чтобы указать ее номер
+                _raise_bad_row(lines, line_num, columns)
+                raise
+
+            if count + len(block) > capacity:
+                # Оцениваем число строк по размеру файла и средней длине прочитанных строк
+                bytes_per_line = max(sum(len(line) for line in lines) / len(lines), 1)
+                estimate = int(os.path.getsize(file_path) / bytes_per_line * 1.05) + 1
+                capacity = max(estimate, 2 * capacity, count + len(block))
+                x_vals = _grow(x_vals, count, capacity)
+                y_vals = _grow(y_vals, count, capacity)
+
+            x_vals[count:count + len(block)] = block[:, 0]
+            y_vals[count:count + len(block)] = block[:, 1]
+            count += len(block)
+            line_num += len(lines)
+
+    if count < capacity * 0.9:
+        return x_vals[:count].copy(), y_vals[:count].copy()
+    return x_vals[:count], y_vals[:count]
+
+
+def _grow(array, count, capacity):
+    grown = np.empty(capacity)
+    grown[:count] = array[:count]
+    return grown
+
+
+def _raise_bad_row(lines, first_line_num, columns):
+    csv_reader = csv.reader(lines)
+    for row in csv_reader:
+        line_num = first_line_num + csv_reader.line_num
+        if not row:
+            continue
+        if len(row) <= max(columns):
+            raise ValueError(f"В строке {line_num} меньше {max(columns) + 1} значений")
+        try:
+            for col in columns:
+                float(row[col])
+        except Exception as e:
+            raise ValueError(f"Неверные данные в строке {line_num}: {e}")
+
+
+def load_table_cached(file_path, columns=(0, 1), header=False):
+    """Загружает таблицу через кэш: разобранный CSV сохраняется в .npy и при повторном открытии отображается в память"""
+    if file_path.lower().endswith('.npy'):
+        return load_npy_table(file_path, columns)
+
+    # Ключ кэша: путь к файлу, его размер и время изменения, а также параметры чтения
+    stat = os.stat(file_path)
+    path_key = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()[:16]
+    version_key = hashlib.sha1(
+        f"{stat.st_size}:{stat.st_mtime_ns}:{tuple(columns)}:{header}".encode()
+    ).hexdigest()[:16]
+    cache_path = os.path.join(TABLE_CACHE_DIR, f"{path_key}-{version_key}.npy")
+
+    if os.path.exists(cache_path):
+        try:
+            table = np.load(cache_path, mmap_mode='r')
+            return table[0], table[1]
+        except (OSError, ValueError):
+            pass
+
+    x_vals, y_vals = load_table(file_path, columns=columns, header=header)
+
+    try:
+        os.makedirs(TABLE_CACHE_DIR, exist_ok=True)
+        # Старые версии кэша того же файла больше не нужны
+        for name in os.listdir(TABLE_CACHE_DIR):
+            if name.startswith(path_key + '-'):
+                os.remove(os.path.join(TABLE_CACHE_DIR, name))
+
+        tmp_path = cache_path + '.tmp'
+        table = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float64, shape=(2, len(x_vals)))
+        table[0] = x_vals
+        table[1] = y_vals
+        table.flush()
+        del table
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Кэш — только ускорение, без него таблица все равно загружена
+        pass
+
+    return x_vals, y_vals
+
+
+def load_npy_table(file_path, columns=(0, 1)):
+    """Открывает .npy без копирования: массив (n, k) читается по столбцам, (k, n) — по строкам"""
+    table = np.load(file_path, mmap_mode='r')
+    if table.ndim != 2:
+        raise ValueError("Файл .npy должен содержать двумерный массив")
+
+    x_col, y_col = columns
+    if table.shape[0] >= table.shape[1]:
+        if max(columns) >= table.shape[1]:
+            raise ValueError(f"В файле только {table.shape[1]} столбцов")
+        return table[:, x_col], table[:, y_col]
+
+    if max(columns) >= table.shape[0]:
+        raise ValueError(f"В файле только {table.shape[0]} строк данных")
+    return table[x_col], table[y_col]
@@ -0,0 +1,216 @@
+import tkinter as tk
+from tkinter import ttk
+from tkinter import filedialog
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+
+import numpy as np
+
+from core import (
+    sample_function, adaptive_sample, minmax_decimate, load_table_cached
+)
+
+
+class DecimatedLine:
+    """Линия табличной функции с уровнем детализации под ширину осей.
+
+    Хранит полные массивы и при каждом изменении масштаба заново прореживает видимый участок,
+    поэтому при увеличении подробности возвращаются.
+    """
+    def __init__(self, ax, x_vals, y_vals, **plot_kwargs):
+        self.ax = ax
+        self.x_vals = x_vals
+        self.y_vals = y_vals
+        self.marker = plot_kwargs.pop('marker', None)
+        # Отсечь невидимую часть можно только если x упорядочены
+        self.is_sorted = bool(np.all(x_vals[1:] >= x_vals[:-1]))
+
+        x_view, y_view, decimated = self.visible_data(None)
+        self.line, = ax.plot(x_view, y_view, marker='None' if decimated else self.marker, **plot_kwargs)
+        ax.callbacks.connect('xlim_changed', self.on_xlim_changed)
+
+    def visible_data(self, xlim):
+        x_vals, y_vals = self.x_vals, self.y_vals
+        if xlim is not None and self.is_sorted:
+            lo = max(np.searchsorted(x_vals, xlim[0], side='left') - 1, 0)
+            hi = np.searchsorted(x_vals, xlim[1], side='right') + 1
+            x_vals, y_vals = x_vals[lo:hi], y_vals[lo:hi]
+
+        width = max(int(self.ax.get_window_extent().width), 1)
+        x_view, y_view = minmax_decimate(x_vals, y_vals, width)
+        return x_view, y_view, len(x_view) < len(x_vals)
+
+    def on_xlim_changed(self, ax):
+        x_view, y_view, decimated = self.visible_data(ax.get_xlim())
+        self.line.set_data(x_view, y_view)
+        # Маркеры рисуем только пока видны все исходные точки участка
+        self.line.set_marker('None' if decimated else self.marker)
+        ax.figure.canvas.draw_idle()
+
+
+class GraphApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("График функций")
+        
+        # Вкладки
+        self.notebook = ttk.Notebook(root)
+        self.analytical_tab = ttk.Frame(self.notebook)
+        self.tabular_tab = ttk.Frame(self.notebook)
+        
+        self.notebook.add(self.analytical_tab, text="Аналитическая функция")
+        self.notebook.add(self.tabular_tab, text="Табличная функция")
+        self.notebook.pack(padx=10, pady=10)
+        
+        self.create_analytical_tab()
+        self.create_tabular_tab()
+        
+    def create_analytical_tab(self):
+        # Поля
+        ttk.Label(self.analytical_tab, text="f(x):").grid(row=0, column=0, padx=5, pady=5)
+        self.formula_entry = ttk.Entry(self.analytical_tab, width=40)
+        self.formula_entry.grid(row=0, column=1, padx=5, pady=5)
+        
+        # Диапазон
+        ttk.Label(self.analytical_tab, text="Диапазон:").grid(row=1, column=0, padx=5, pady=5)
+        self.x_min = ttk.Entry(self.analytical_tab, width=10)
+        self.x_max = ttk.Entry(self.analytical_tab, width=10)
+        self.x_min.grid(row=1, column=1, sticky=tk.W, padx=5)
+        self.x_max.grid(row=1, column=1, sticky=tk.E, padx=5)
+        
+        # Кнопка 
+        plot_btn = ttk.Button(self.analytical_tab, text="Построить", command=self.plot_analytical)
+        plot_btn.grid(row=2, column=1, padx=5, pady=10)
+        
+        # График
+        self.fig_analytical = plt.Figure(figsize=(5, 4))
+        self.ax_analytical = self.fig_analytical.add_subplot(111)
+        self.canvas_analytical = FigureCanvasTkAgg(self.fig_analytical, self.analytical_tab)
+        self.canvas_analytical.get_tk_widget().grid(row=3, column=0, columnspan=2)
+        
+        # Масштаб
+        toolbar_frame = ttk.Frame(self.analytical_tab)
+        toolbar_frame.grid(row=4, column=0, columnspan=2)
+
+        self.toolbar_analytical = NavigationToolbar2Tk(self.canvas_analytical, toolbar_frame)
+        self.toolbar_analytical.update()
+
+
+    def create_tabular_tab(self):
+        ttk.Label(self.tabular_tab, text="Выберите файл:").grid(row=0, column=0, padx=5, pady=5)
+        self.file_path_label = ttk.Label(self.tabular_tab, text="Нет файла")
+        self.file_path_label.grid(row=1, column=0, padx=5, pady=5)
+
+        # Параметры чтения файла
+        options_frame = ttk.Frame(self.tabular_tab)
+        options_frame.grid(row=0, column=1, padx=5, pady=5)
+        self.header_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="Строка заголовка", variable=self.header_var).pack(side=tk.LEFT, padx=5)
+        ttk.Label(options_frame, text="Столбцы X, Y:").pack(side=tk.LEFT)
+        self.x_column_var = tk.IntVar(value=1)
+        self.y_column_var = tk.IntVar(value=2)
+        ttk.Spinbox(options_frame, from_=1, to=100, textvariable=self.x_column_var, width=4).pack(side=tk.LEFT, padx=2)
+        ttk.Spinbox(options_frame, from_=1, to=100, textvariable=self.y_column_var, width=4).pack(side=tk.LEFT, padx=2)
+        
+
+        plot_btn = ttk.Button(self.tabular_tab, text="Построить", command=self.plot_tabular)
+        plot_btn.grid(row=1, column=1, padx=5, pady=10)
+
+        # График
+        self.fig_tabular = plt.Figure(figsize=(5, 4))
+        self.ax_tabular = self.fig_tabular.add_subplot(111)
+        self.canvas_tabular = FigureCanvasTkAgg(self.fig_tabular, self.tabular_tab)
+        self.canvas_tabular.get_tk_widget().grid(row=3, column=0, columnspan=2)
+
+        # Масштаб
+        toolbar_frame = ttk.Frame(self.tabular_tab)
+        toolbar_frame.grid(row=4, column=0, columnspan=2)
+        
+        self.toolbar_tabular = NavigationToolbar2Tk(self.canvas_tabular, toolbar_frame)
+        self.toolbar_tabular.update()
+        
+    def plot_analytical(self):
+        try:
+            formula = self.formula_entry.get().strip()
+            x_min_str = self.x_min.get().strip()
+            x_max_str = self.x_max.get().strip()
+
+            if not formula:
+                raise ValueError("Введите формулу")
+            if not x_min_str or not x_max_str:
+                raise ValueError("Заполните диапазон X")
+
+            x_min = float(x_min_str)
+            x_max = float(x_max_str)
+
+            if x_min >= x_max:
+                raise ValueError("X min должно быть меньше X max")
+
+            # Размер области графика в пикселях задает точность адаптивной выборки
+            bbox = self.ax_analytical.get_window_extent()
+            x_vals, y_vals = adaptive_sample(formula, x_min, x_max, bbox.width, bbox.height)
+
+            self.ax_analytical.clear()
+
+            self.ax_analytical.plot(x_vals, y_vals, label=formula)
+            self.ax_analytical.set_title("График аналитической функции")
+            self.ax_analytical.set_xlabel("X")
+            self.ax_analytical.set_ylabel("Y")
+            self.ax_analytical.grid(True)
+            self.ax_analytical.legend()
+
+            # Около полюсов значения огромны — ограничиваем ось Y основной частью графика
+            # (квантили считаются по равномерной сетке: адаптивные точки сгущены у полюсов)
+            finite = y_vals[np.isfinite(y_vals)]
+            uniform = sample_function(formula, np.linspace(x_min, x_max, 1000))
+            uniform = uniform[np.isfinite(uniform)]
+            if finite.size and uniform.size:
+                y_low, y_high = np.percentile(uniform, [2, 98])
+                span = y_high - y_low
+                if span > 0 and finite.max() - finite.min() > 10 * span:
+                    self.ax_analytical.set_ylim(y_low - 0.2 * span, y_high + 0.2 * span)
+
+            self.canvas_analytical.draw()
+
+        except Exception as e:
+            tk.messagebox.showerror("Ошибка", str(e))
+            
+    def plot_tabular(self):
+        try:
+            file_path = filedialog.askopenfilename(
+                title="Выберите csv файл",
+                filetypes=[("CSV Files", "*.csv"), ("NumPy Files", "*.npy"), ("All Files", "*.*")],
+            )
+
+            if not file_path:
+                return
+            
+            columns = (self.x_column_var.get() - 1, self.y_column_var.get() - 1)
+            if min(columns) < 0:
+                raise ValueError("Номера столбцов начинаются с 1")
+            x_vals, y_vals = load_table_cached(file_path, columns=columns, header=self.header_var.get())
+
+            self.ax_tabular.clear()
+
+            self.tabular_line = DecimatedLine(self.ax_tabular, x_vals, y_vals,
+                                              marker='o', label='Табличная функция')
+            self.ax_tabular.set_title("Табличная функция")
+            self.ax_tabular.set_xlabel("X")
+            self.ax_tabular.set_ylabel("Y")
+            self.ax_tabular.grid(True)
+            self.ax_tabular.legend()
+
+            self.canvas_tabular.draw()
+            
+            self.file_path_label.config(text=file_path)
+            
+        except Exception as e:
+            tk.messagebox.showerror("Ошибка", str(e))
+
+
+def run():
+    root = tk.Tk()
+    app = GraphApp(root)
+    root.mainloop()
@@ -1,8 +1,5 @@
 import numpy as np
 import math
-import matplotlib.pyplot as plt
-from matplotlib.colors import LogNorm
-from scipy.optimize import minimize
 
 
 def f_fun(xy):
@@ -80,6 +77,10 @@ def coordinate_descent_2d(xy0, eps=1e-4, max_iter=500, plotting=True):
     xy = np.array([x, y], dtype=float)
 
     if plotting:
+        # с plotting=False спуск вызывается без matplotlib
+        import matplotlib.pyplot as plt
+        from matplotlib.colors import LogNorm
+
         xs = np.linspace(x - 1.0, x + 1.0, 201)
         ys = np.linspace(y - 1.0, y + 1.0, 201)
         X, Y = np.meshgrid(xs, ys)
@@ -139,6 +140,7 @@ def Phi_vec(p):
 
 
 if __name__ == "__main__":
+    from scipy.optimize import minimize
     
     res = minimize(Phi_vec, x0=[0.5, 0.5])
     print(res)  
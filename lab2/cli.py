@@ -0,0 +1,191 @@
+"""Пакетный запуск решателей без графического интерфейса.
+
+Файл заданий — JSON Lines или CSV с полями formula, a, b, epsilon и необязательными
+task (root | all_roots) и method (dichotomy | brent | illinois | itp).
+Результаты выводятся построчно в формате JSON Lines в порядке заданий.
+
+    python cli.py jobs.jsonl > results.jsonl
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from core import compile_formula, ROOT_METHODS, find_all_roots, CountingFunction
+
+
+# Имена методов для командной строки
+METHOD_ALIASES = {
+    'dichotomy': 'Дихотомия',
+    'brent': 'Брент',
+    'illinois': 'Иллинойс',
+    'itp': 'ITP',
+}
+
+
+# Числовые поля задания: проверяются уже при чтении
+NUMERIC_FIELDS = ('a', 'b', 'epsilon')
+
+
+def read_jobs(file):
+    """Построчно читает задания из JSON Lines или CSV (определяется по первой строке).
+
+    Строка, которую не удалось разобрать, или задание с нечисловыми a, b, epsilon
+    дают задание с полем error (номер строки и сообщение) вместо исключения.
+    """
+    first = file.readline()
+    lines = _chain_line(first, file)
+    rows = _json_rows(lines) if first.lstrip().startswith('{') else _csv_rows(lines)
+
+    for number, (line_number, row) in enumerate(rows, 1):
+        if 'error' not in row:
+            try:
+                for field in NUMERIC_FIELDS:
+                    # в короткой строке CSV недостающие поля равны None
+                    if row[field] is None:
+                        raise KeyError(field)
+                    float(row[field])
+            except KeyError as e:
+                row = {'id': row.get('id'), 'error': f"Нет поля {e}"}
+            except (TypeError, ValueError) as e:
+                row = {'id': row.get('id'), 'error': str(e)}
+        if 'error' in row:
+            row['error'] = f"Строка {line_number}: {row['error']}"
+        if row.get('id') is None:
+            row['id'] = number
+        yield row
+
+
+def _json_rows(lines):
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError("ожидается объект JSON")
+        except ValueError as e:
+            row = {'error': str(e)}
+        yield line_number, row
+
+
+def _csv_rows(lines):
+    reader = csv.DictReader(lines)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            row = {'error': str(e)}
+        yield reader.line_num, row
+
+
+def _chain_line(first, file):
+    yield first
+    yield from file
+
+
+def run_job(job, with_iterations=False):
+    """Решает одно задание и возвращает словарь, пригодный для JSON"""
+    result = {'id': job.get('id')}
+    if 'error' in job:
+        # Ошибка чтения задания, найденная в read_jobs
+        result['error'] = job['error']
+        return result
+    try:
+        task = (job.get('task') or 'root').strip()
+        formula = str(job['formula']).strip()
+        a = float(job['a'])
+        b = float(job['b'])
+        epsilon = float(job['epsilon'])
+        if a >= b:
+            raise ValueError("a должно быть меньше b")
+
+        func = CountingFunction(compile_formula(formula))
+
+        if task == 'root':
+            method_name = (job.get('method') or 'dichotomy').strip()
+            method, _ = ROOT_METHODS[METHOD_ALIASES.get(method_name, method_name)]
+            solution = method(func, a, b, epsilon)
+            result.update(root=solution['root'], f_root=solution['f_root'])
+        elif task == 'all_roots':
+            solution = find_all_roots(formula, a, b, epsilon)
+            result.update(roots=solution['roots'].tolist(), f_roots=solution['f_roots'].tolist(),
+                          steps=solution['steps'])
+        else:
+            raise ValueError(f"Неизвестная задача: {task}")
+
+        if 'iterations' in solution:
+            result['iteration_count'] = len(solution['iterations'])
+            if with_iterations:
+                result['iterations'] = solution['iterations']
+        if func.count:
+            result['evaluations'] = func.count
+
+    except KeyError as e:
+        result['error'] = f"Нет поля или метода: {e}"
+    except Exception as e:
+        result['error'] = str(e)
+
+    return result
+
+
+def run_chunk(jobs, with_iterations=False):
+    return [run_job(job, with_iterations) for job in jobs]
+
+
+def run_jobs(jobs, workers=None, chunk_size=64, with_iterations=False):
+    """Решает задания в пуле процессов и выдает результаты в исходном порядке.
+
+    Задания читаются и отправляются порциями, так что в памяти находится лишь
+    несколько порций на процесс, а не весь файл.
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = iter(jobs)
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def submit():
+            chunk = list(islice(jobs, chunk_size))
+            if chunk:
+                pending.append(executor.submit(run_chunk, chunk, with_iterations))
+            return bool(chunk)
+
+        while len(pending) < workers * 4 and submit():
+            pass
+
+        while pending:
+            results = pending.popleft().result()
+            submit()
+            yield from results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетный поиск корней")
+    parser.add_argument('jobs', help="файл заданий (.jsonl или .csv), '-' — стандартный ввод")
+    parser.add_argument('-o', '--output', help="файл результатов (по умолчанию стандартный вывод)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="число процессов")
+    parser.add_argument('--chunk-size', type=int, default=64, help="заданий в одной порции")
+    parser.add_argument('--iterations', action='store_true', help="выводить таблицы итераций")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.jobs == '-' else open(args.jobs, newline='', encoding='utf-8')
+    target = sys.stdout if args.output is None else open(args.output, 'w', encoding='utf-8')
+    try:
+        for result in run_jobs(read_jobs(source), args.workers, args.chunk_size, args.iterations):
+            target.write(json.dumps(result, ensure_ascii=False) + '\n')
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+
+if __name__ == "__main__":
+    main()
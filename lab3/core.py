@@ -0,0 +1,1273 @@
+"""Вычислительная часть: разбор формул, загрузка таблиц и численные методы (без tkinter и matplotlib)"""
+
+import os
+import csv
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from time import perf_counter
+
+import numpy as np
+
+
+# Каталог кэша разобранных табличных файлов
+TABLE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'vichmath')
+
+# Число точек для графиков решателей
+PREVIEW_POINTS = 100_000
+
+# Число точек сетки при поиске всех экстремумов
+EXTREMA_SCAN_POINTS = 1_000_000
+
+# Имена, доступные в формулах
+FORMULA_NAMESPACE = {
+    'np': np,
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'exp': np.exp,
+    'log': np.log,
+    'sqrt': np.sqrt,
+    'abs': np.abs,
+    'pi': np.pi,
+    'e': np.e,
+    'pow': np.power
+}
+
+# Разрешенные узлы синтаксического дерева формулы
+ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.Attribute,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv,
+    ast.UAdd, ast.USub,
+)
+
+
+@lru_cache(maxsize=128)
+def compile_formula(formula, parameters=()):
+    """Разбирает формулу один раз и компилирует ее в функцию f(x) (или f(x, *parameters))"""
+    for name in parameters:
+        if not name.isidentifier() or name == 'x':
+            raise ValueError(f"Недопустимое имя параметра: {name}")
+    
+    try:
+        tree = ast.parse(formula, mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Синтаксическая ошибка в формуле: {e.msg}")
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_NODES):
+            raise ValueError(f"Недопустимая конструкция в формуле: {type(node).__name__}")
+        if (isinstance(node, ast.Name) and node.id != 'x' and node.id not in parameters
+                and node.id not in FORMULA_NAMESPACE):
+            raise ValueError(f"Неизвестное имя в формуле: {node.id}")
+        if isinstance(node, ast.Attribute):
+            if not (isinstance(node.value, ast.Name) and node.value.id == 'np') or node.attr.startswith('_'):
+                raise ValueError(f"Недопустимое обращение к атрибуту: {node.attr}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"Недопустимая константа в формуле: {node.value!r}")
+
+    # Оборачиваем выражение в lambda x, *parameters: ..., чтобы x передавался аргументом
+    func_tree = ast.Expression(body=ast.Lambda(
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(arg=name) for name in ('x', *parameters)], kwonlyargs=[],
+                           kw_defaults=[], defaults=[]),
+        body=tree.body,
+    ))
+    ast.fix_missing_locations(func_tree)
+    code = compile(func_tree, '<formula>', 'eval')
+    return eval(code, {'__builtins__': {}, **FORMULA_NAMESPACE})
+
+
+def sample_function(formula, x_vals):
+    """Вычисляет формулу на всей сетке за один вызов, ошибки и бесконечности заменяются на NaN"""
+    x_vals = np.asarray(x_vals, dtype=float)
+    func = compile_formula(formula)
+
+    with np.errstate(all='ignore'):
+        try:
+            y_vals = np.asarray(func(x_vals), dtype=float)
+        except (ArithmeticError, TypeError, ValueError):
+            # Формула не векторизуется — считаем по точкам
+            y_vals = np.array([_evaluate_point(func, x) for x in x_vals], dtype=float)
+
+    y_vals = np.array(np.broadcast_to(y_vals, x_vals.shape), dtype=float)
+    y_vals[~np.isfinite(y_vals)] = np.nan
+    return y_vals
+
+
+def _evaluate_point(func, x):
+    try:
+        return float(func(x))
+    except (ArithmeticError, TypeError, ValueError):
+        return np.nan
+
+
+def adaptive_sample(formula, x_min, x_max, width_px=800, height_px=600,
+                    pixel_tol=0.5, max_evals=20000, initial_points=65):
+    """Адаптивная выборка точек графика: сгущает сетку там, где кривая изгибается или скачет.
+
+    Возвращает массивы x, y; в местах разрывов вставлены NaN, чтобы линия не соединялась.
+    """
+    x_vals = np.linspace(x_min, x_max, initial_points)
+    y_vals = sample_function(formula, x_vals)
+    evaluations = initial_points
+
+    # Масштаб экрана: пикселей на единицу по x и по y (по устойчивому размаху значений)
+    x_scale = width_px / (x_max - x_min)
+    finite = y_vals[np.isfinite(y_vals)]
+    if finite.size:
+        y_low, y_high = np.percentile(finite, [5, 95])
+    else:
+        y_low, y_high = 0.0, 1.0
+    y_scale = height_px / (y_high - y_low if y_high > y_low else 1.0)
+    min_width = 0.01 / x_scale
+
+    # Индексы отрезков [x[i], x[i+1]], которые нужно проверить
+    active = np.arange(len(x_vals) - 1)
+
+    while active.size and evaluations < max_evals:
+        active = active[(x_vals[active + 1] - x_vals[active]) > min_width]
+        if active.size > max_evals - evaluations:
+            active = active[:max_evals - evaluations]
+        if not active.size:
+            break
+
+        x_left, x_right = x_vals[active], x_vals[active + 1]
+        y_left, y_right = y_vals[active], y_vals[active + 1]
+        x_mid = (x_left + x_right) / 2
+        y_mid = sample_function(formula, x_mid)
+        evaluations += active.size
+
+        # Отклонение середины от хорды в пикселях; NaN на одном из концов — граница области определения
+        deviation = np.abs(y_mid - (y_left + y_right) / 2) * y_scale
+        nan_count = np.isnan(y_left).astype(int) + np.isnan(y_mid) + np.isnan(y_right)
+        refine = (deviation > pixel_tol) | ((nan_count > 0) & (nan_count < 3))
+
+        x_vals = np.insert(x_vals, active + 1, x_mid)
+        y_vals = np.insert(y_vals, active + 1, y_mid)
+
+        # После вставки k-й середины отрезок active[k] распался на два с индексами active[k] + k и +1
+        shifted = active[refine] + np.flatnonzero(refine)
+        active = np.concatenate([shifted, shifted + 1])
+        active.sort()
+
+    # Разрыв: скачок больше половины высоты экрана на отрезке, который не удалось сгладить,
+    # причем направление скачка расходится с обоими соседями (полюс или ступенька, а не крутой склон)
+    steps = np.diff(y_vals)
+    widths = np.diff(x_vals)
+    unresolved = np.zeros(len(widths), dtype=bool)
+    unresolved[active] = True
+    direction = np.sign(steps)
+    previous = np.concatenate([[np.nan], direction[:-1]])
+    following = np.concatenate([direction[1:], [np.nan]])
+    breaks = np.flatnonzero(
+        (np.abs(steps) * y_scale > height_px / 2)
+        & ((widths <= 2 * min_width) | unresolved)
+        & (direction != previous) & (direction != following)
+    )
+
+    x_vals = np.insert(x_vals, breaks + 1, (x_vals[breaks] + x_vals[breaks + 1]) / 2)
+    y_vals = np.insert(y_vals, breaks + 1, np.nan)
+    return x_vals, y_vals
+
+
+def minmax_decimate(x_vals, y_vals, buckets):
+    """Прореживание min/max: в каждой корзине остаются точки минимума и максимума (в порядке следования)"""
+    n = len(x_vals)
+    if n <= 2 * buckets:
+        return x_vals, y_vals
+
+    size = -(-n // buckets)
+    count = n // size
+    blocks = y_vals[:count * size].reshape(count, size)
+    offsets = np.arange(count) * size
+    idx_min = np.argmin(np.where(np.isnan(blocks), np.inf, blocks), axis=1) + offsets
+    idx_max = np.argmax(np.where(np.isnan(blocks), -np.inf, blocks), axis=1) + offsets
+
+    indices = [[0], np.minimum(idx_min, idx_max), np.maximum(idx_min, idx_max)]
+    if count * size < n:
+        tail = y_vals[count * size:]
+        if not np.all(np.isnan(tail)):
+            indices.append(count * size + np.array([np.nanargmin(tail), np.nanargmax(tail)]))
+    indices.append([n - 1])
+
+    indices = np.unique(np.concatenate(indices))
+    return x_vals[indices], y_vals[indices]
+
+
+def load_table(file_path, columns=(0, 1), header=False, chunk_rows=100_000):
+    """Читает CSV частями сразу в массивы float64 (по 16 байт на пару x, y)"""
+    columns = tuple(columns)
+    capacity = 0
+    x_vals = np.empty(0)
+    y_vals = np.empty(0)
+    count = 0
+    line_num = 0
+
+    with open(file_path, 'r', newline='') as f:
+        if header:
+            f.readline()
+            line_num = 1
+
+        while True:
+            lines = list(islice(f, chunk_rows))
+            if not lines:
+                break
+
+            try:
+                block = np.loadtxt(lines, delimiter=',', usecols=columns, ndmin=2,
+                                   comments=None, quotechar='"', dtype=np.float64)
+            except ValueError:
+                # Построчно ищем первую плохую строку, чтобы указать ее номер
+                _raise_bad_row(lines, line_num, columns)
+                raise
+
+            if count + len(block) > capacity:
+                # Оцениваем число строк по размеру файла и средней длине прочитанных строк
+                bytes_per_line = max(sum(len(line) for line in lines) / len(lines), 1)
+                estimate = int(os.path.getsize(file_path) / bytes_per_line * 1.05) + 1
+                capacity = max(estimate, 2 * capacity, count + len(block))
+                x_vals = _grow(x_vals, count, capacity)
+                y_vals = _grow(y_vals, count, capacity)
+
+            x_vals[count:count + len(block)] = block[:, 0]
+            y_vals[count:count + len(block)] = block[:, 1]
+            count += len(block)
+            line_num += len(lines)
+
+    if count < capacity * 0.9:
+        return x_vals[:count].copy(), y_vals[:count].copy()
+    return x_vals[:count], y_vals[:count]
+
+
+def _grow(array, count, capacity):
+    grown = np.empty(capacity)
+    grown[:count] = array[:count]
+    return grown
+
+
+def _raise_bad_row(lines, first_line_num, columns):
+    csv_reader = csv.reader(lines)
+    for row in csv_reader:
+        line_num = first_line_num + csv_reader.line_num
+        if not row:
+            continue
+        if len(row) <= max(columns):
+            raise ValueError(f"В строке {line_num} меньше {max(columns) + 1} значений")
+        try:
+            for col in columns:
+                float(row[col])
+        except Exception as e:
+            raise ValueError(f"Неверные данные в строке {line_num}: {e}")
+
+
+def load_table_cached(file_path, columns=(0, 1), header=False):
+    """Загружает таблицу через кэш: разобранный CSV сохраняется в .npy и при повторном открытии отображается в память"""
+    if file_path.lower().endswith('.npy'):
+        return load_npy_table(file_path, columns)
+
+    # Ключ кэша: путь к файлу, его размер и время изменения, а также параметры чтения
+    stat = os.stat(file_path)
+    path_key = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()[:16]
+    version_key = hashlib.sha1(
+        f"{stat.st_size}:{stat.st_mtime_ns}:{tuple(columns)}:{header}".encode()
+    ).hexdigest()[:16]
+    cache_path = os.path.join(TABLE_CACHE_DIR, f"{path_key}-{version_key}.npy")
+
+    if os.path.exists(cache_path):
+        try:
+            table = np.load(cache_path, mmap_mode='r')
+            return table[0], table[1]
+        except (OSError, ValueError):
+            pass
+
+    x_vals, y_vals = load_table(file_path, columns=columns, header=header)
+
+    try:
+        os.makedirs(TABLE_CACHE_DIR, exist_ok=True)
+        # Старые версии кэша того же файла больше не нужны
+        for name in os.listdir(TABLE_CACHE_DIR):
+            if name.startswith(path_key + '-'):
+                os.remove(os.path.join(TABLE_CACHE_DIR, name))
+
+        tmp_path = cache_path + '.tmp'
+        table = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float64, shape=(2, len(x_vals)))
+        table[0] = x_vals
+        table[1] = y_vals
+        table.flush()
+        del table
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Кэш — только ускорение, без него таблица все равно загружена
+        pass
+
+    return x_vals, y_vals
+
+
+def load_npy_table(file_path, columns=(0, 1)):
+    """Открывает .npy без копирования: массив (n, k) читается по столбцам, (k, n) — по строкам"""
+    table = np.load(file_path, mmap_mode='r')
+    if table.ndim != 2:
+        raise ValueError("Файл .npy должен содержать двумерный массив")
+
+    x_col, y_col = columns
+    if table.shape[0] >= table.shape[1]:
+        if max(columns) >= table.shape[1]:
+            raise ValueError(f"В файле только {table.shape[1]} столбцов")
+        return table[:, x_col], table[:, y_col]
+
+    if max(columns) >= table.shape[0]:
+        raise ValueError(f"В файле только {table.shape[0]} строк данных")
+    return table[x_col], table[y_col]
+
+
+class SolverCancelled(Exception):
+    """Вычисление остановлено пользователем"""
+
+
+class CountingFunction:
+    """Обертка над функцией, считающая число ее вычислений"""
+    def __init__(self, func):
+        self.func = func
+        self.count = 0
+
+    def __call__(self, x):
+        self.count += 1
+        return self.func(x)
+
+
+class PointCache:
+    """Ограниченный LRU-кэш значений f(x) по паре (формула, x) со статистикой попаданий.
+
+    Общий для решателей и графиков, поэтому уже вычисленные точки (корень, точки
+    производных, повторное решение на том же отрезке) не считаются заново.
+    """
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self.values = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def evaluate(self, formula, x):
+        key = (formula, x)
+        with self.lock:
+            if key in self.values:
+                self.hits += 1
+                self.values.move_to_end(key)
+                return self.values[key]
+            self.misses += 1
+
+        # Вычисляем вне блокировки: формула может быть дорогой
+        value = compile_formula(formula)(x)
+
+        with self.lock:
+            self.values[key] = value
+            self.values.move_to_end(key)
+            if len(self.values) > self.maxsize:
+                self.values.popitem(last=False)
+        return value
+
+    def function(self, formula):
+        """f(x) для формулы, вычисляемая через кэш"""
+        return lambda x: self.evaluate(formula, x)
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self.values),
+                    'maxsize': self.maxsize, 'hit_rate': self.hits / total if total else 0.0}
+
+    def clear(self):
+        with self.lock:
+            self.values.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Кэш точек, общий для всех вкладок
+POINT_CACHE = PointCache()
+
+
+# Названия этапов решения для отчета профилирования
+PHASE_TITLES = {
+    'solve': 'решение',
+    'derivatives': 'производные',
+    'comparison': 'сравнение',
+    'display': 'отображение',
+    'plot': 'график',
+}
+
+
+class Instrumentation:
+    """Счетчики вычислений функции, время итераций и таймеры этапов решения.
+
+    Выключенный экземпляр возвращает функции и progress без оберток, а этапы
+    не замеряет, поэтому на ход вычислений не влияет. Если передан cache,
+    в отчет попадают его попадания и промахи за время замера.
+    """
+    def __init__(self, enabled=True, cache=None):
+        self.enabled = enabled
+        self.cache = cache
+        self._cache_start = cache.stats() if cache is not None and enabled else None
+        self.evaluations = {}
+        self.eval_time = {}
+        self.phases = {}
+        self.iteration_times = []
+        self.current_phase = None
+        self._last_tick = None
+
+    def wrap(self, func):
+        """Функция, считающая вызовы и время вычислений по текущему этапу"""
+        if not self.enabled:
+            return func
+
+        def instrumented(x):
+            start = perf_counter()
+            try:
+                return func(x)
+            finally:
+                phase = self.current_phase or 'other'
+                self.evaluations[phase] = self.evaluations.get(phase, 0) + 1
+                self.eval_time[phase] = self.eval_time.get(phase, 0.0) + perf_counter() - start
+
+        return instrumented
+
+    def wrap_progress(self, progress=None):
+        """progress, дополнительно замеряющий время между соседними итерациями"""
+        if not self.enabled:
+            return progress
+        self._last_tick = perf_counter()
+
+        def tick(value, maximum):
+            now = perf_counter()
+            self.iteration_times.append(now - self._last_tick)
+            self._last_tick = now
+            if progress:
+                progress(value, maximum)
+
+        return tick
+
+    @contextmanager
+    def phase(self, name):
+        """Замеряет время этапа; вычисления функции внутри относятся к нему"""
+        if not self.enabled:
+            yield
+            return
+        previous, self.current_phase = self.current_phase, name
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + perf_counter() - start
+            self.current_phase = previous
+
+    def to_dict(self):
+        times = self.iteration_times
+        return {
+            'evaluations': dict(self.evaluations),
+            'evaluations_total': sum(self.evaluations.values()),
+            'eval_time': dict(self.eval_time),
+            'phases': dict(self.phases),
+            'iterations': {
+                'count': len(times),
+                'total': sum(times),
+                'mean': sum(times) / len(times) if times else 0.0,
+                'max': max(times, default=0.0),
+            },
+            'iteration_times': list(times),
+            'point_cache': self.cache_stats(),
+        }
+
+    def cache_stats(self):
+        """Попадания и промахи кэша точек с момента создания замера"""
+        if self._cache_start is None:
+            return None
+        current = self.cache.stats()
+        return {'hits': current['hits'] - self._cache_start['hits'],
+                'misses': current['misses'] - self._cache_start['misses'],
+                'size': current['size'], 'maxsize': current['maxsize']}
+
+    def report(self):
+        """Краткий текстовый отчет для панели результатов"""
+        data = self.to_dict()
+
+        lines = ["Профиль:"]
+        if data['evaluations']:
+            lines.append("Вычислений функции: " + ", ".join(
+                f"{PHASE_TITLES.get(name, name)} {count}" for name, count in data['evaluations'].items()))
+            lines.append(f"Время вычислений функции: {_format_ms(sum(data['eval_time'].values()))}")
+        cache = data['point_cache']
+        if cache is not None and cache['hits'] + cache['misses']:
+            lines.append(f"Кэш точек: попаданий {cache['hits']}, промахов {cache['misses']}, "
+                         f"записей {cache['size']} из {cache['maxsize']}")
+        iterations = data['iterations']
+        if iterations['count']:
+            lines.append(f"Итераций: {iterations['count']}, в среднем {_format_ms(iterations['mean'])}, "
+                         f"максимум {_format_ms(iterations['max'])}")
+        if data['phases']:
+            lines.append("Этапы: " + ", ".join(
+                f"{PHASE_TITLES.get(name, name)} {_format_ms(seconds)}"
+                for name, seconds in data['phases'].items()))
+        return "\n".join(lines)
+
+
+def _format_ms(seconds):
+    return f"{seconds * 1000:.3f} мс"
+
+
+def collect_iterations(steps, progress=None, maximum=None, on_record=None):
+    """Прогоняет генератор решателя до конца: записи итераций собираются в список,
+    progress(итерация, maximum) и on_record(запись) вызываются после каждого шага.
+    Возвращает итог генератора, дополненный ключом 'iterations'."""
+    iterations = []
+    while True:
+        try:
+            record = next(steps)
+        except StopIteration as stop:
+            result = stop.value
+            break
+        iterations.append(record)
+        if on_record:
+            on_record(record)
+        if progress:
+            progress(record['iteration'], maximum)
+
+    result['iterations'] = iterations
+    return result
+
+
+def _bisection_steps(a, b, epsilon):
+    """Число шагов дихотомии до длины отрезка 2 * epsilon"""
+    return max(int(np.ceil(np.log2((b - a) / (2 * epsilon)))), 0)
+
+
+def iter_dichotomy(func, a, b, epsilon):
+    """Метод дихотомии как генератор: выдает запись каждой итерации сразу после шага,
+    а по завершении возвращает {'root', 'f_root', 'evaluations'}.
+
+    Вызывающий может прервать цикл раньше (например, когда отрезок уже меньше
+    нужного для показа) — история итераций при этом нигде не накапливается.
+    """
+    func = CountingFunction(func)
+    fa = func(a)
+    fb = func(b)
+
+    # Проверяем, что функция меняет знак на интервале
+    if fa * fb >= 0:
+        raise ValueError("Функция должна менять знак на интервале [a, b]")
+
+    iteration_count = 0
+
+    while (b - a) / 2 > epsilon:
+        iteration_count += 1
+        c = (a + b) / 2
+        fc = func(c)
+
+        yield {
+            'iteration': iteration_count,
+            'a': a,
+            'b': b,
+            'c': c,
+            'f_c': fc,
+            'interval_length': b - a
+        }
+
+        if abs(fc) < epsilon:
+            break
+
+        if fa * fc < 0:
+            b = c
+            fb = fc
+        else:
+            a = c
+            fa = fc
+
+    root = (a + b) / 2
+    f_root = func(root)
+    return {'root': root, 'f_root': f_root, 'evaluations': func.count}
+
+
+def dichotomy_method(func, a, b, epsilon, progress=None, on_record=None):
+    """Метод дихотомии. progress(итерация, ожидаемое число итераций) вызывается после каждого шага"""
+    return collect_iterations(iter_dichotomy(func, a, b, epsilon), progress,
+                              max(_bisection_steps(a, b, epsilon), 1), on_record)
+
+
+def iter_brent(func, a, b, epsilon, max_iterations=1000):
+    """Метод Брента как генератор (см. iter_dichotomy)"""
+    f = CountingFunction(func)
+    fa = f(a)
+    fb = f(b)
+
+    if fa * fb >= 0:
+        raise ValueError("Функция должна менять знак на интервале [a, b]")
+
+    # Корень всегда лежит между b (лучшее приближение) и c
+    c, fc = a, fa
+    d = e = b - a
+    iteration_count = 0
+
+    while iteration_count < max_iterations:
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2 * np.finfo(float).eps * abs(b) + 0.5 * epsilon
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0:
+            break
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Секущая
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                # Обратная квадратичная интерполяция
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        fb = f(b)
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+
+        iteration_count += 1
+        yield {
+            'iteration': iteration_count,
+            'a': min(b, c),
+            'b': max(b, c),
+            'c': b,
+            'f_c': fb,
+            'interval_length': abs(c - b)
+        }
+
+        if abs(fb) < epsilon:
+            break
+
+    return {'root': b, 'f_root': fb, 'evaluations': f.count}
+
+
+def brent_method(func, a, b, epsilon, progress=None, max_iterations=1000, on_record=None):
+    """Метод Брента: обратная квадратичная интерполяция и секущие с гарантией дихотомии"""
+    return collect_iterations(iter_brent(func, a, b, epsilon, max_iterations), progress, None, on_record)
+
+
+def iter_illinois(func, a, b, epsilon, max_iterations=1000):
+    """Метод Иллинойс как генератор (см. iter_dichotomy)"""
+    f = CountingFunction(func)
+    fa = f(a)
+    fb = f(b)
+
+    if fa * fb >= 0:
+        raise ValueError("Функция должна менять знак на интервале [a, b]")
+
+    iteration_count = 0
+    side = 0
+    c, fc = a, fa
+
+    while (b - a) / 2 > epsilon and iteration_count < max_iterations:
+        iteration_count += 1
+        c = (a * fb - b * fa) / (fb - fa)
+        fc = f(c)
+
+        yield {
+            'iteration': iteration_count,
+            'a': a,
+            'b': b,
+            'c': c,
+            'f_c': fc,
+            'interval_length': b - a
+        }
+
+        if abs(fc) < epsilon:
+            break
+
+        # Если один конец сохраняется второй раз подряд, его значение делится пополам
+        if fa * fc < 0:
+            b, fb = c, fc
+            if side == -1:
+                fa /= 2
+            side = -1
+        else:
+            a, fa = c, fc
+            if side == 1:
+                fb /= 2
+            side = 1
+
+    return {'root': c, 'f_root': fc, 'evaluations': f.count}
+
+
+def illinois_method(func, a, b, epsilon, progress=None, max_iterations=1000, on_record=None):
+    """Метод ложного положения с модификацией Иллинойс"""
+    return collect_iterations(iter_illinois(func, a, b, epsilon, max_iterations), progress, None, on_record)
+
+
+def iter_itp(func, a, b, epsilon, k1=None, k2=2, n0=1):
+    """Метод ITP как генератор (см. iter_dichotomy)"""
+    f = CountingFunction(func)
+    fa = f(a)
+    fb = f(b)
+
+    if fa * fb >= 0:
+        raise ValueError("Функция должна менять знак на интервале [a, b]")
+
+    if k1 is None:
+        k1 = 0.2 / (b - a)
+    n_max = _bisection_steps(a, b, epsilon) + n0
+    iteration_count = 0
+
+    # Кроме длины отрезка проверяется и число шагов: из-за округления отрезок может
+    # не сжаться до 2 * epsilon за n_max шагов, а больше n_max метод делать не должен
+    while iteration_count < n_max and (b - a) / 2 > epsilon:
+        x_half = (a + b) / 2
+        radius = epsilon * 2 ** (n_max - iteration_count) - (b - a) / 2
+        delta = k1 * (b - a) ** k2
+
+        # Интерполяция (ложное положение), усечение к середине, проекция в окрестность середины
+        x_f = (b * fa - a * fb) / (fa - fb)
+        sigma = np.sign(x_half - x_f)
+        x_t = x_f + sigma * delta if delta <= abs(x_half - x_f) else x_half
+        c = x_t if abs(x_t - x_half) <= radius else x_half - sigma * radius
+        fc = f(c)
+
+        iteration_count += 1
+        yield {
+            'iteration': iteration_count,
+            'a': a,
+            'b': b,
+            'c': c,
+            'f_c': fc,
+            'interval_length': b - a
+        }
+
+        if abs(fc) < epsilon:
+            a = b = c
+            break
+
+        if fa * fc > 0:
+            a, fa = c, fc
+        else:
+            b, fb = c, fc
+
+    root = (a + b) / 2
+    return {'root': root, 'f_root': f(root), 'evaluations': f.count}
+
+
+def itp_method(func, a, b, epsilon, progress=None, k1=None, k2=2, n0=1, on_record=None):
+    """Метод ITP (Interpolate–Truncate–Project): не больше шагов, чем у дихотомии, плюс n0"""
+    return collect_iterations(iter_itp(func, a, b, epsilon, k1, k2, n0), progress,
+                              _bisection_steps(a, b, epsilon) + n0, on_record)
+
+
+def solve_parametric(formula, parameter, p_values, a, b, epsilon, max_iterations=200):
+    """Решает f(x; p) = 0 сразу для массива значений параметра векторной дихотомией.
+
+    a и b — общие границы или массивы границ для каждого значения p.
+    Возвращает массивы корней, чисел итераций и признаков сходимости.
+    """
+    func = compile_formula(formula, (parameter,))
+    # Скаляр p обрабатывается как массив из одного элемента: маски должны быть изменяемыми
+    shape = np.shape(p_values)
+    p_values = np.atleast_1d(np.asarray(p_values, dtype=float))
+    a = np.array(np.broadcast_to(np.asarray(a, dtype=float), p_values.shape))
+    b = np.array(np.broadcast_to(np.asarray(b, dtype=float), p_values.shape))
+
+    with np.errstate(all='ignore'):
+        fa = np.array(np.broadcast_to(func(a, p_values), p_values.shape), dtype=float)
+        fb = np.array(np.broadcast_to(func(b, p_values), p_values.shape), dtype=float)
+
+        # Нуль на границе сразу дает корень; без смены знака параметр не решается
+        b = np.where(fa == 0, a, b)
+        a = np.where(fb == 0, b, a)
+        valid = (fa * fb < 0) | (fa == 0) | (fb == 0)
+        iterations = np.zeros(p_values.shape, dtype=int)
+        active = valid & ((b - a) / 2 > epsilon)
+
+        for _ in range(max_iterations):
+            idx = np.flatnonzero(active)
+            if not idx.size:
+                break
+
+            c = (a.flat[idx] + b.flat[idx]) / 2
+            fc = np.broadcast_to(func(c, p_values.flat[idx]), c.shape)
+            iterations.flat[idx] += 1
+
+            in_left = fa.flat[idx] * fc < 0
+            found = np.abs(fc) < epsilon
+            a.flat[idx] = np.where(found, c, np.where(in_left, a.flat[idx], c))
+            b.flat[idx] = np.where(found, c, np.where(in_left, c, b.flat[idx]))
+            fa.flat[idx] = np.where(in_left, fa.flat[idx], fc)
+
+            active.flat[idx] = (b.flat[idx] - a.flat[idx]) / 2 > epsilon
+
+    roots = np.where(valid, (a + b) / 2, np.nan)
+    converged = valid & ((b - a) / 2 <= epsilon)
+    return {'roots': roots.reshape(shape), 'iterations': iterations.reshape(shape),
+            'converged': converged.reshape(shape)}
+
+
+# Методы уточнения корня на отрезке со сменой знака: название -> (функция, подпись графика)
+ROOT_METHODS = {
+    'Дихотомия': (dichotomy_method, 'методом дихотомии'),
+    'Брент': (brent_method, 'методом Брента'),
+    'Иллинойс': (illinois_method, 'методом Иллинойс'),
+    'ITP': (itp_method, 'методом ITP'),
+}
+
+
+def find_all_roots(formula, a, b, epsilon, samples=PREVIEW_POINTS, progress=None):
+    """Находит все корни на [a, b]: смены знака ищутся на сетке одним векторным вызовом,
+    затем дихотомия идет сразу по всем найденным отрезкам — один векторный шаг на итерацию"""
+    x_vals = np.linspace(a, b, samples)
+    y_vals = sample_function(formula, x_vals)
+
+    # Отрезки сетки со сменой знака (сравнения с NaN дают False)
+    bracket = y_vals[:-1] * y_vals[1:] < 0
+    left, right = x_vals[:-1][bracket], x_vals[1:][bracket]
+    f_left = y_vals[:-1][bracket]
+    f_bound = np.maximum(np.abs(f_left), np.abs(y_vals[1:][bracket]))
+
+    step = (b - a) / (samples - 1)
+    expected = max(int(np.ceil(np.log2(step / (2 * epsilon)))), 1)
+    steps = 0
+
+    while left.size and step / 2 > epsilon:
+        steps += 1
+        step /= 2
+        middle = (left + right) / 2
+        f_middle = sample_function(formula, middle)
+
+        # Корень в левой половине, если на ней функция меняет знак; точный ноль
+        # в середине — корень найден, отрезок стягивается в точку
+        exact = f_middle == 0
+        in_left = f_left * f_middle < 0
+        right = np.where(in_left | exact, middle, right)
+        left = np.where(in_left, left, middle)
+        f_left = np.where(in_left, f_left, f_middle)
+
+        if progress:
+            progress(steps, expected)
+
+    roots = (left + right) / 2
+    f_roots = sample_function(formula, roots)
+
+    # Смена знака через полюс (tan, 1/x) дает рост |f| к середине — такие отрезки не корни
+    is_root = np.abs(f_roots) <= f_bound
+    roots = np.concatenate([roots[is_root], x_vals[y_vals == 0]])
+    order = np.argsort(roots)
+    roots = roots[order]
+    f_roots = np.concatenate([f_roots[is_root], np.zeros(np.count_nonzero(y_vals == 0))])[order]
+
+    return {'roots': roots, 'f_roots': f_roots, 'steps': steps}
+
+
+def iter_parabolic(func, a, b, epsilon, max_iterations=1000):
+    """Метод парабол как генератор: выдает запись каждой итерации, по завершении
+    возвращает {'x', 'f'} (см. iter_dichotomy)"""
+    x1 = a
+    x3 = b
+    x2 = (a + b) / 2
+
+    f1 = func(x1)
+    f2 = func(x2)
+    f3 = func(x3)
+
+    iteration_count = 0
+    edge_tol = max(epsilon * 0.1, 1e-10)
+
+    while iteration_count < max_iterations:
+        iteration_count += 1
+
+        numerator = ((x2 - x1) ** 2) * (f2 - f3) - ((x2 - x3) ** 2) * (f2 - f1)
+        denominator = ((x2 - x1) * (f2 - f3)) - ((x2 - x3) * (f2 - f1))
+
+        if abs(denominator) < 1e-14:
+            x_new = (x1 + x3) / 2
+        else:
+            x_new = x2 - 0.5 * numerator / denominator
+
+        if not (x1 < x_new < x3):
+            x_new = (x1 + x3) / 2
+
+        if x_new - x1 < edge_tol:
+            x_new = x1 + edge_tol
+        elif x3 - x_new < edge_tol:
+            x_new = x3 - edge_tol
+        if abs(x_new - x2) < edge_tol:
+            shift = edge_tol if x_new < x2 else -edge_tol
+            x_new = min(max(x1 + edge_tol, x_new + shift), x3 - edge_tol)
+
+        f_new = func(x_new)
+
+        iteration_info = {
+            'iteration': iteration_count,
+            'x1': x1,
+            'x2': x2,
+            'x3': x3,
+            'x_new': x_new,
+            'f_new': f_new,
+            'interval_length': abs(x3 - x1)
+        }
+
+        if f_new < f2:
+            if x_new < x2:
+                x3, f3 = x2, f2
+            else:
+                x1, f1 = x2, f2
+            x2, f2 = x_new, f_new
+        else:
+            if x_new < x2:
+                x1, f1 = x_new, f_new
+            else:
+                x3, f3 = x_new, f_new
+
+        iteration_info['interval_length'] = abs(x3 - x1)
+        yield iteration_info
+
+        if iteration_info['interval_length'] < epsilon:
+            break
+
+    return {'x': x2, 'f': f2}
+
+
+def parabolic_method(func, a, b, epsilon, progress=None, max_iterations=1000, on_record=None):
+    """Поиск минимума методом парабол. progress(итерация, None) вызывается после каждого шага"""
+    return collect_iterations(iter_parabolic(func, a, b, epsilon, max_iterations), progress, None, on_record)
+
+
+def iter_brent_minimize(func, a, b, epsilon, max_iterations=1000):
+    """Поиск минимума методом Брента как генератор (см. iter_parabolic)"""
+    golden = (3 - 5 ** 0.5) / 2
+    x = w = v = a + golden * (b - a)
+    fx = fw = fv = func(x)
+    d = e = 0.0
+
+    iteration_count = 0
+
+    while iteration_count < max_iterations:
+        middle = (a + b) / 2
+        tol1 = 1.5e-8 * abs(x) + epsilon / 4
+        tol2 = 2 * tol1
+        if abs(x - middle) <= tol2 - (b - a) / 2:
+            break
+        iteration_count += 1
+
+        use_golden = True
+        if abs(e) > tol1:
+            # Парабола через x, w, v
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            e_prev, e = e, d
+
+            # Шаг принимается, если он внутри отрезка и меньше половины позапрошлого
+            if abs(p) < abs(q * e_prev / 2) and q * (a - x) < p < q * (b - x):
+                d = p / q
+                u = x + d
+                if u - a < tol2 or b - u < tol2:
+                    d = tol1 if middle >= x else -tol1
+                use_golden = False
+
+        if use_golden:
+            e = (a if x >= middle else b) - x
+            d = golden * e
+
+        u = x + d if abs(d) >= tol1 else x + (tol1 if d > 0 else -tol1)
+        f_new = func(u)
+
+        iteration_info = {
+            'iteration': iteration_count,
+            'x1': a,
+            'x2': x,
+            'x3': b,
+            'x_new': u,
+            'f_new': f_new,
+            'interval_length': abs(b - a)
+        }
+
+        if f_new <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, w, x = w, x, u
+            fv, fw, fx = fw, fx, f_new
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if f_new <= fw or w == x:
+                v, w = w, u
+                fv, fw = fw, f_new
+            elif f_new <= fv or v == x or v == w:
+                v, fv = u, f_new
+
+        iteration_info['interval_length'] = abs(b - a)
+        yield iteration_info
+
+    return {'x': x, 'f': fx}
+
+
+def brent_minimize(func, a, b, epsilon, progress=None, max_iterations=1000, on_record=None):
+    """Поиск минимума методом Брента: парабола через три лучшие точки, а если ее шаг
+    ненадежен — золотое сечение. Записи итераций совпадают с методом парабол:
+    x1, x3 — текущий отрезок, x2 — лучшая точка, x_new — новая точка."""
+    return collect_iterations(iter_brent_minimize(func, a, b, epsilon, max_iterations), progress, None, on_record)
+
+
+# Методы поиска минимума на отрезке: название -> (функция, подпись для заголовка графика)
+EXTREMUM_METHODS = {
+    'Парабол': (parabolic_method, 'методом парабол'),
+    'Брент': (brent_minimize, 'методом Брента'),
+}
+
+
+def find_all_extrema(formula, a, b, epsilon, samples=EXTREMA_SCAN_POINTS, progress=None, max_steps=200):
+    """Находит все локальные экстремумы на (a, b).
+
+    Кандидаты — узлы сетки, где np.diff меняет знак (полюса и скачки отбрасываются);
+    затем все кандидаты уточняются одновременно: на каждом векторном шаге каждая
+    тройка x1 < x2 < x3 получает шаг параболы (или золотого сечения, если парабола
+    не сужает отрезок) до точности epsilon.
+    """
+    x_vals = np.linspace(a, b, samples)
+    y_vals = sample_function(formula, x_vals)
+
+    # Смена знака наклона (сравнения с NaN дают False, поэтому разрывы отсекаются сами)
+    slope = np.diff(y_vals)
+    is_maximum = (slope[:-1] > 0) & (slope[1:] < 0)
+    is_minimum = (slope[:-1] < 0) & (slope[1:] > 0)
+    center = np.flatnonzero(is_minimum | is_maximum) + 1
+    # У экстремума наклон к нему убывает по модулю (f' ≈ f''·(x - x*)), а у полюса растет:
+    # если наклон рядом с кандидатом круче следующего за ним, это полюс или скачок
+    steepness = np.abs(np.concatenate([[np.inf], slope, [np.inf]]))
+    pole = (steepness[center] > steepness[center - 1]) | (steepness[center + 1] > steepness[center + 2])
+    center = center[~pole]
+    is_minimum = is_minimum[center - 1]
+
+    # Ищем минимум s*f: для максимумов s = -1
+    sign = np.where(is_minimum, 1.0, -1.0)
+    x1, x2, x3 = x_vals[center - 1], x_vals[center], x_vals[center + 1]
+    f1, f2, f3 = sign * y_vals[center - 1], sign * y_vals[center], sign * y_vals[center + 1]
+    # Уточнение не может опустить значение ниже узла сетки больше, чем на перепад к соседям
+    f_bound = np.maximum(f1 - f2, f3 - f2)
+    f_start = f2.copy()
+
+    tol = epsilon / 2
+    golden = np.zeros(center.size, dtype=bool)
+    expected = max(int(np.ceil(np.log2(max(x3[0] - x1[0], 2 * epsilon) / epsilon))), 1) if center.size else 1
+    active = np.flatnonzero(x3 - x1 > 2 * epsilon)
+    steps = 0
+
+    with np.errstate(all='ignore'):
+        while active.size and steps < max_steps:
+            steps += 1
+            a1, a2, a3 = x1[active], x2[active], x3[active]
+            b1, b2, b3 = f1[active], f2[active], f3[active]
+            width = a3 - a1
+
+            # Вершина параболы через три точки
+            numerator = (a2 - a1) ** 2 * (b2 - b3) - (a2 - a3) ** 2 * (b2 - b1)
+            denominator = (a2 - a1) * (b2 - b3) - (a2 - a3) * (b2 - b1)
+            u = a2 - 0.5 * numerator / denominator
+
+            # Золотое сечение большей части, если парабола вырождена или отрезок сужается медленно
+            golden_point = np.where(a2 - a1 > a3 - a2, a2 - 0.381966 * (a2 - a1), a2 + 0.381966 * (a3 - a2))
+            bad = golden[active] | ~(u > a1) | ~(u < a3)
+            u = np.where(bad, golden_point, u)
+
+            # Не подходим к уже вычисленным точкам ближе tol
+            u = np.clip(u, a1 + tol, a3 - tol)
+            too_close = np.abs(u - a2) < tol
+            u = np.where(too_close, np.where(a3 - a2 > a2 - a1, a2 + tol, a2 - tol), u)
+
+            fu = sign[active] * sample_function(formula, u)
+
+            # Новая тройка: лучшая точка в центре, отрезок сужается до ее соседей
+            better = fu < b2
+            left = u < a2
+            x1[active] = np.where(better, np.where(left, a1, a2), np.where(left, u, a1))
+            x3[active] = np.where(better, np.where(left, a2, a3), np.where(left, a3, u))
+            f1[active] = np.where(better, np.where(left, b1, b2), np.where(left, fu, b1))
+            f3[active] = np.where(better, np.where(left, b2, b3), np.where(left, b3, fu))
+            x2[active] = np.where(better, u, a2)
+            f2[active] = np.where(better, fu, b2)
+
+            golden[active] = (x3[active] - x1[active]) > 0.7 * width
+            active = active[x3[active] - x1[active] > 2 * epsilon]
+
+            if progress:
+                progress(steps, max(expected, steps))
+
+    keep = np.isfinite(f2) & (f_start - f2 <= 2 * f_bound)
+    order = np.argsort(x2[keep])
+    return {
+        'x': x2[keep][order],
+        'f': (sign * f2)[keep][order],
+        'is_minimum': is_minimum[keep][order],
+        'steps': steps,
+    }
+
+
+def numerical_derivative(func, x, h=1e-8):
+    """Численное дифференцирование"""
+    try:
+        return (func(x + h) - func(x - h)) / (2 * h)
+    except Exception:
+        return None
+
+
+def numerical_second_derivative(func, x, h=1e-6):
+    """Численная вторая производная"""
+    try:
+        return (func(x + h) - 2*func(x) + func(x - h)) / (h**2)
+    except Exception:
+        return None
+
+
+def solve_extremum(func, a, b, epsilon, progress=None, instrumentation=None, method=parabolic_method,
+                   on_record=None):
+    """Поиск минимума (по умолчанию методом парабол) с проверкой найденной точки
+    по первой и второй производным.
+
+    instrumentation разделяет замеры на этапы решения и вычисления производных.
+    """
+    instrumentation = instrumentation or Instrumentation(enabled=False)
+    counted = CountingFunction(func)
+    with instrumentation.phase('solve'):
+        result = method(counted, a, b, epsilon, instrumentation.wrap_progress(progress), on_record=on_record)
+    result['evaluations'] = counted.count
+    with instrumentation.phase('derivatives'):
+        result['first_derivative'] = numerical_derivative(func, result['x'])
+        result['second_derivative'] = numerical_second_derivative(func, result['x'])
+    return result
+
+
+# Число процессов для параллельного поиска
+PROCESS_POOL_WORKERS = os.cpu_count() or 1
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def process_pool():
+    """Общий пул процессов: создается при первом обращении и переиспользуется,
+    чтобы запуск процессов не повторялся на каждом решении"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=PROCESS_POOL_WORKERS)
+        return _process_pool
+
+
+def _extremum_task(formula, a, b, epsilon, method_name, maximum):
+    """Поиск минимума (или максимума) на одном подотрезке; выполняется в процессе пула"""
+    start = perf_counter()
+    func = compile_formula(formula)
+    counted = CountingFunction((lambda x: -func(x)) if maximum else func)
+    method, _ = EXTREMUM_METHODS[method_name]
+    result = method(counted, a, b, epsilon)
+    return {
+        'x': float(result['x']),
+        'f': float(-result['f'] if maximum else result['f']),
+        'is_minimum': not maximum,
+        'a': a,
+        'b': b,
+        'evaluations': counted.count,
+        'time': perf_counter() - start,
+    }
+
+
+def multistart_extrema(formula, a, b, epsilon, parts, method_name='Брент', progress=None):
+    """Глобальный поиск: [a, b] делится на parts подотрезков, на каждом в пуле процессов
+    ищутся минимум и максимум. Совпадающие в пределах epsilon точки объединяются."""
+    edges = np.linspace(a, b, parts + 1)
+    tasks = [(formula, float(lo), float(hi), epsilon, method_name, maximum)
+             for lo, hi in zip(edges[:-1], edges[1:]) for maximum in (False, True)]
+
+    start = perf_counter()
+    pool = process_pool()
+    futures = [pool.submit(_extremum_task, *task) for task in tasks]
+    results = []
+    try:
+        for done_count, future in enumerate(as_completed(futures), 1):
+            results.append(future.result())
+            if progress:
+                progress(done_count, len(futures))
+    except BrokenProcessPool:
+        global _process_pool
+        with _process_pool_lock:
+            _process_pool = None
+        raise
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    wall_time = perf_counter() - start
+
+    results = [r for r in results if np.isfinite(r['f'])]
+    func = compile_formula(formula)
+
+    def is_extremum(r):
+        # Точка у внутренней границы подотрезка — обычно лишь край монотонного куска,
+        # поэтому она принимается, только если по обе стороны функция хуже
+        edge_tol = 3 * epsilon + 3e-8 * abs(r['x'])
+        if r['x'] - r['a'] > edge_tol and r['b'] - r['x'] > edge_tol:
+            return True
+        if r['x'] - a <= edge_tol or b - r['x'] <= edge_tol:
+            return False
+        delta = 10 * edge_tol
+        sign = 1 if r['is_minimum'] else -1
+        return sign * func(r['x'] - delta) > sign * r['f'] and sign * func(r['x'] + delta) > sign * r['f']
+
+    # Объединение дубликатов: соседние точки одного типа ближе epsilon
+    extrema = []
+    for r in sorted(filter(is_extremum, results), key=lambda r: (r['is_minimum'], r['x'])):
+        last = extrema[-1] if extrema else None
+        if last and last['is_minimum'] == r['is_minimum'] and r['x'] - last['x'] <= epsilon:
+            sign = 1 if r['is_minimum'] else -1
+            if sign * r['f'] < sign * last['f']:
+                extrema[-1] = r
+        else:
+            extrema.append(r)
+    extrema.sort(key=lambda r: r['x'])
+
+    return {
+        'extrema': [{'x': r['x'], 'f': r['f'], 'is_minimum': r['is_minimum']} for r in extrema],
+        'minimum': min(results, key=lambda r: r['f'], default=None),
+        'maximum': max(results, key=lambda r: r['f'], default=None),
+        'tasks': len(tasks),
+        'workers': min(PROCESS_POOL_WORKERS, len(tasks)),
+        'evaluations': sum(r['evaluations'] for r in results),
+        'wall_time': wall_time,
+        'task_time': sum(r['time'] for r in results),
+    }
@@ -0,0 +1,1033 @@
+import tkinter as tk
+from tkinter import ttk
+from tkinter import filedialog
+from tkinter import messagebox
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+
+import json
+import os
+import sys
+
+import numpy as np
+
+from core import (
+    PREVIEW_POINTS, compile_formula, sample_function, adaptive_sample, minmax_decimate,
+    load_table_cached, SolverCancelled, Instrumentation, POINT_CACHE, ROOT_METHODS,
+    find_all_roots, find_all_extrema, numerical_derivative, numerical_second_derivative, solve_extremum,
+    EXTREMUM_METHODS, CountingFunction, multistart_extrema
+)
+
+# common/ лежит рядом с каталогами лабораторных
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from common.taskpanel import TaskPanel, close_on_delete
+
+
+class DecimatedLine:
+    """Линия табличной функции с уровнем детализации под ширину осей.
+
+    Хранит полные массивы и при каждом изменении масштаба заново прореживает видимый участок,
+    поэтому при увеличении подробности возвращаются.
+    """
+    def __init__(self, ax, x_vals, y_vals, **plot_kwargs):
+        self.ax = ax
+        self.x_vals = x_vals
+        self.y_vals = y_vals
+        self.marker = plot_kwargs.pop('marker', None)
+        # Отсечь невидимую часть можно только если x упорядочены
+        self.is_sorted = bool(np.all(x_vals[1:] >= x_vals[:-1]))
+
+        x_view, y_view, decimated = self.visible_data(None)
+        self.line, = ax.plot(x_view, y_view, marker='None' if decimated else self.marker, **plot_kwargs)
+        ax.callbacks.connect('xlim_changed', self.on_xlim_changed)
+
+    def visible_data(self, xlim):
+        x_vals, y_vals = self.x_vals, self.y_vals
+        if xlim is not None and self.is_sorted:
+            lo = max(np.searchsorted(x_vals, xlim[0], side='left') - 1, 0)
+            hi = np.searchsorted(x_vals, xlim[1], side='right') + 1
+            x_vals, y_vals = x_vals[lo:hi], y_vals[lo:hi]
+
+        width = max(int(self.ax.get_window_extent().width), 1)
+        x_view, y_view = minmax_decimate(x_vals, y_vals, width)
+        return x_view, y_view, len(x_view) < len(x_vals)
+
+    def on_xlim_changed(self, ax):
+        x_view, y_view, decimated = self.visible_data(ax.get_xlim())
+        self.line.set_data(x_view, y_view)
+        # Маркеры рисуем только пока видны все исходные точки участка
+        self.line.set_marker('None' if decimated else self.marker)
+        ax.figure.canvas.draw_idle()
+
+
+class IterationLog(ttk.Frame):
+    """Журнал итераций с виртуальной прокруткой.
+
+    Записи хранятся как есть, а в Text форматируются и вставляются одним вызовом
+    только видимые строки, поэтому вывод не зависит от длины трассы.
+    """
+    def __init__(self, parent, height=8, width=80):
+        super().__init__(parent)
+        self.height = height
+        self.header = ""
+        self.records = []
+        self.formatter = str
+        self.top = 0
+
+        self.text = tk.Text(self, height=height + 2, width=width, wrap=tk.NONE)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.text.grid(row=0, column=0, sticky="ew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.columnconfigure(0, weight=1)
+
+        self.text.bind('<MouseWheel>', lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        self.text.bind('<Button-4>', lambda e: self.scroll(-1))
+        self.text.bind('<Button-5>', lambda e: self.scroll(1))
+
+    def set_records(self, header, records, formatter):
+        """Показывает записи; formatter(record) возвращает строку таблицы"""
+        self.header = header
+        self.records = records
+        self.formatter = formatter
+        self.top = 0
+        self.render()
+
+    def append_records(self, records):
+        """Дописывает записи; если был виден конец журнала, прокрутка следует за ним"""
+        at_end = self.top + self.height >= len(self.records)
+        self.records.extend(records)
+        if at_end:
+            self.top = len(self.records) - self.height
+        self.render()
+
+    def clear(self):
+        self.set_records("", [], str)
+
+    def scroll(self, count):
+        self.top += count * 3
+        self.render()
+        return "break"
+
+    def yview(self, *args):
+        if args[0] == 'moveto':
+            self.top = int(float(args[1]) * len(self.records))
+        elif args[0] == 'scroll':
+            count = int(args[1])
+            if args[2] == 'pages':
+                count *= self.height
+            self.top += count
+        self.render()
+
+    def render(self):
+        total = len(self.records)
+        self.top = max(0, min(self.top, total - self.height))
+        rows = self.records[self.top:self.top + self.height]
+
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, self.header + "".join(self.formatter(row) for row in rows))
+
+        if total:
+            self.scrollbar.set(self.top / total, (self.top + len(rows)) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+class ScrollableFrame(ttk.Frame):
+    def __init__(self, container, *args, **kwargs):
+        super().__init__(container, *args, **kwargs)
+        
+        # Создаем канвас и скроллбар
+        self.canvas = tk.Canvas(self)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.scrollable_frame = ttk.Frame(self.canvas)
+
+        self.scrollable_frame.bind(
+            "<Configure>",
+            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        )
+
+        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        # Биндим колесико мыши
+        self.bind_mousewheel()
+
+    def bind_mousewheel(self):
+        def _on_mousewheel(event):
+            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        
+        def _bind_to_mousewheel(event):
+            self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
+
+        def _unbind_from_mousewheel(event):
+            self.canvas.unbind_all("<MouseWheel>")
+
+        self.canvas.bind('<Enter>', _bind_to_mousewheel)
+        self.canvas.bind('<Leave>', _unbind_from_mousewheel)
+
+
+# Журнал итераций методов уточнения корня
+ROOT_LOG_HEADER = (f"{'№':<3} {'a':<12} {'b':<12} {'c':<12} {'f(c)':<12} {'|b-a|':<12}\n"
+                   + "-" * 75 + "\n")
+
+
+def format_root_record(iter_data):
+    return (f"{iter_data['iteration']:<3} "
+            f"{iter_data['a']:<12.6f} "
+            f"{iter_data['b']:<12.6f} "
+            f"{iter_data['c']:<12.6f} "
+            f"{iter_data['f_c']:<12.6e} "
+            f"{iter_data['interval_length']:<12.6e}\n")
+
+
+# Журнал итераций методов поиска экстремума
+EXTREMUM_LOG_HEADER = (f"{'№':<3} {'x1':<10} {'x2':<10} {'x3':<10} {'x_new':<10} {'f_new':<12} {'|x3-x1|':<12}\n"
+                       + "-" * 80 + "\n")
+
+
+def format_extremum_record(iter_data):
+    return (f"{iter_data['iteration']:<3} "
+            f"{iter_data['x1']:<10.6f} "
+            f"{iter_data['x2']:<10.6f} "
+            f"{iter_data['x3']:<10.6f} "
+            f"{iter_data['x_new']:<10.6f} "
+            f"{iter_data['f_new']:<12.6f} "
+            f"{iter_data['interval_length']:<12.6e}\n")
+
+
+class GraphApp:
+    def __init__(self, root):
+        self.root = root
+        # Последние замеры профилирования по вкладкам
+        self.profiles = {}
+        # Закраска текущего отрезка решателя на каждом графике
+        self.bracket_spans = {}
+        self.root.title("График функций")
+        self.root.geometry("1200x800")  # Устанавливаем начальный размер
+        self.extrema_formula = "(x-1.5) * sqrt(x + 4) + sin(pi*x)"
+
+        # Вкладки
+        self.notebook = ttk.Notebook(root)
+        
+        # Создаем скроллируемые фреймы для каждой вкладки
+        self.analytical_scroll = ScrollableFrame(self.notebook)
+        self.tabular_scroll = ScrollableFrame(self.notebook)
+        self.dichotomy_scroll = ScrollableFrame(self.notebook)
+        self.extrema_scroll = ScrollableFrame(self.notebook)
+        
+        self.notebook.add(self.analytical_scroll, text="Аналитическая функция")
+        self.notebook.add(self.tabular_scroll, text="Табличная функция")
+        self.notebook.add(self.dichotomy_scroll, text="Метод дихотомии")
+        self.notebook.add(self.extrema_scroll, text="Поиск экстремума")
+        self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Получаем ссылки на внутренние фреймы
+        self.analytical_tab = self.analytical_scroll.scrollable_frame
+        self.tabular_tab = self.tabular_scroll.scrollable_frame
+        self.dichotomy_tab = self.dichotomy_scroll.scrollable_frame
+        self.extrema_tab = self.extrema_scroll.scrollable_frame
+        
+        self.create_analytical_tab()
+        self.create_tabular_tab()
+        self.create_dichotomy_tab()
+        self.create_extrema_tab()
+        
+    def create_analytical_tab(self):
+        # Поля
+        ttk.Label(self.analytical_tab, text="f(x):").grid(row=0, column=0, padx=5, pady=5)
+        self.formula_entry = ttk.Entry(self.analytical_tab, width=40)
+        self.formula_entry.grid(row=0, column=1, padx=5, pady=5)
+        
+        # Диапазон
+        ttk.Label(self.analytical_tab, text="Диапазон:").grid(row=1, column=0, padx=5, pady=5)
+        self.x_min = ttk.Entry(self.analytical_tab, width=10)
+        self.x_max = ttk.Entry(self.analytical_tab, width=10)
+        self.x_min.grid(row=1, column=1, sticky=tk.W, padx=5)
+        self.x_max.grid(row=1, column=1, sticky=tk.E, padx=5)
+        
+        # Кнопки 
+        button_frame = ttk.Frame(self.analytical_tab)
+        button_frame.grid(row=2, column=1, padx=5, pady=10)
+        
+        plot_btn = ttk.Button(button_frame, text="Построить", command=self.plot_analytical)
+        plot_btn.pack(side=tk.LEFT, padx=5)
+        
+        extrema_btn = ttk.Button(button_frame, text="Найти экстремумы", command=self.find_extrema_points)
+        extrema_btn.pack(side=tk.LEFT, padx=5)
+        
+        ttk.Label(button_frame, text="ε:").pack(side=tk.LEFT)
+        self.extrema_scan_epsilon_entry = ttk.Entry(button_frame, width=10)
+        self.extrema_scan_epsilon_entry.insert(0, "0.000001")
+        self.extrema_scan_epsilon_entry.pack(side=tk.LEFT, padx=5)
+        
+        # График (уменьшенный размер)
+        self.fig_analytical = plt.Figure(figsize=(8, 5))
+        self.ax_analytical = self.fig_analytical.add_subplot(111)
+        self.canvas_analytical = FigureCanvasTkAgg(self.fig_analytical, self.analytical_tab)
+        self.canvas_analytical.get_tk_widget().grid(row=3, column=0, columnspan=2, padx=5, pady=5)
+        
+        # Масштаб
+        toolbar_frame = ttk.Frame(self.analytical_tab)
+        toolbar_frame.grid(row=4, column=0, columnspan=2)
+
+        self.toolbar_analytical = NavigationToolbar2Tk(self.canvas_analytical, toolbar_frame)
+        self.toolbar_analytical.update()
+
+        # Результаты экстремумов (с ограниченной высотой)
+        results_frame = ttk.LabelFrame(self.analytical_tab, text="Результаты поиска экстремумов", padding=10)
+        results_frame.grid(row=5, column=0, columnspan=2, padx=5, pady=10, sticky="ew")
+        
+        self.extrema_results_text = tk.Text(results_frame, height=6, width=80, wrap=tk.WORD)
+        extrema_scroll = ttk.Scrollbar(results_frame, orient="vertical", command=self.extrema_results_text.yview)
+        self.extrema_results_text.configure(yscrollcommand=extrema_scroll.set)
+        self.extrema_results_text.grid(row=0, column=0, sticky="ew")
+        extrema_scroll.grid(row=0, column=1, sticky="ns")
+
+    def create_tabular_tab(self):
+        ttk.Label(self.tabular_tab, text="Выберите файл:").grid(row=0, column=0, padx=5, pady=5)
+        self.file_path_label = ttk.Label(self.tabular_tab, text="Нет файла", width=50, wraplength=300)
+        self.file_path_label.grid(row=1, column=0, padx=5, pady=5)
+
+        # Параметры чтения файла
+        options_frame = ttk.Frame(self.tabular_tab)
+        options_frame.grid(row=0, column=1, padx=5, pady=5)
+        self.header_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="Строка заголовка", variable=self.header_var).pack(side=tk.LEFT, padx=5)
+        ttk.Label(options_frame, text="Столбцы X, Y:").pack(side=tk.LEFT)
+        self.x_column_var = tk.IntVar(value=1)
+        self.y_column_var = tk.IntVar(value=2)
+        ttk.Spinbox(options_frame, from_=1, to=100, textvariable=self.x_column_var, width=4).pack(side=tk.LEFT, padx=2)
+        ttk.Spinbox(options_frame, from_=1, to=100, textvariable=self.y_column_var, width=4).pack(side=tk.LEFT, padx=2)
+        
+        plot_btn = ttk.Button(self.tabular_tab, text="Построить", command=self.plot_tabular)
+        plot_btn.grid(row=1, column=1, padx=5, pady=10)
+
+        # График (уменьшенный размер)
+        self.fig_tabular = plt.Figure(figsize=(8, 5))
+        self.ax_tabular = self.fig_tabular.add_subplot(111)
+        self.canvas_tabular = FigureCanvasTkAgg(self.fig_tabular, self.tabular_tab)
+        self.canvas_tabular.get_tk_widget().grid(row=2, column=0, columnspan=2, padx=5, pady=5)
+
+        # Масштаб
+        toolbar_frame = ttk.Frame(self.tabular_tab)
+        toolbar_frame.grid(row=3, column=0, columnspan=2)
+        
+        self.toolbar_tabular = NavigationToolbar2Tk(self.canvas_tabular, toolbar_frame)
+        self.toolbar_tabular.update()
+        
+    def create_dichotomy_tab(self):
+        # Функция
+        ttk.Label(self.dichotomy_tab, text="f(x) = 0:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
+        self.dichotomy_formula_entry = ttk.Entry(self.dichotomy_tab, width=40)
+        self.dichotomy_formula_entry.grid(row=0, column=1, columnspan=2, padx=5, pady=5)
+        
+        # Интервал
+        ttk.Label(self.dichotomy_tab, text="Интервал [a, b]:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
+        self.a_entry = ttk.Entry(self.dichotomy_tab, width=15)
+        self.a_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
+        ttk.Label(self.dichotomy_tab, text=",").grid(row=1, column=1, padx=5, pady=5)
+        self.b_entry = ttk.Entry(self.dichotomy_tab, width=15)
+        self.b_entry.grid(row=1, column=2, padx=5, pady=5, sticky=tk.W)
+        
+        # Точность
+        ttk.Label(self.dichotomy_tab, text="Точность ε:").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
+        self.epsilon_entry = ttk.Entry(self.dichotomy_tab, width=15)
+        self.epsilon_entry.insert(0, "0.0001")
+        self.epsilon_entry.grid(row=2, column=1, padx=5, pady=5, sticky=tk.W)
+        self.all_roots_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.dichotomy_tab, text="Все корни на [a, b]", variable=self.all_roots_var).grid(
+            row=2, column=2, padx=5, pady=5, sticky=tk.W)
+        
+        # Метод
+        method_frame = ttk.Frame(self.dichotomy_tab)
+        method_frame.grid(row=3, column=0, padx=5, pady=10, sticky=tk.W)
+        ttk.Label(method_frame, text="Метод:").pack(side=tk.LEFT)
+        self.root_method_var = tk.StringVar(value='Дихотомия')
+        ttk.Combobox(method_frame, textvariable=self.root_method_var, values=list(ROOT_METHODS),
+                     width=12, state='readonly').pack(side=tk.LEFT, padx=5)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(method_frame, text="Профилирование", variable=self.profile_var).pack(side=tk.LEFT, padx=5)
+        
+        # Кнопка решения
+        solve_btn = ttk.Button(self.dichotomy_tab, text="Решить", command=self.solve_dichotomy)
+        solve_btn.grid(row=3, column=1, padx=5, pady=10)
+        self.dichotomy_task = TaskPanel(self.dichotomy_tab, SolverCancelled)
+        self.dichotomy_task.grid(row=3, column=2, padx=5, pady=10, sticky=tk.W)
+        
+        # График (уменьшенный размер)
+        self.fig_dichotomy = plt.Figure(figsize=(8, 5))
+        self.ax_dichotomy = self.fig_dichotomy.add_subplot(111)
+        self.canvas_dichotomy = FigureCanvasTkAgg(self.fig_dichotomy, self.dichotomy_tab)
+        self.canvas_dichotomy.get_tk_widget().grid(row=4, column=0, columnspan=3, padx=5, pady=5)
+        
+        # Масштаб
+        toolbar_frame_dichotomy = ttk.Frame(self.dichotomy_tab)
+        toolbar_frame_dichotomy.grid(row=5, column=0, columnspan=3)
+        self.toolbar_dichotomy = NavigationToolbar2Tk(self.canvas_dichotomy, toolbar_frame_dichotomy)
+        self.toolbar_dichotomy.update()
+        
+        # Результаты
+        results_frame = ttk.LabelFrame(self.dichotomy_tab, text="Результаты", padding=10)
+        results_frame.grid(row=6, column=0, columnspan=3, padx=5, pady=10, sticky="ew")
+        
+        # Текстовое поле для итераций (уменьшенная высота)
+        ttk.Label(results_frame, text="Итерационная последовательность:").grid(row=0, column=0, sticky=tk.W)
+        self.iterations_log = IterationLog(results_frame, height=8, width=80)
+        self.iterations_log.grid(row=1, column=0, columnspan=3, sticky="ew")
+        
+        # Результат
+        self.result_label = ttk.Label(results_frame, text="", wraplength=600)
+        self.result_label.grid(row=2, column=0, columnspan=2, pady=10, sticky=tk.W)
+        ttk.Button(results_frame, text="Профиль в JSON",
+                   command=lambda: self.export_profile('dichotomy')).grid(row=2, column=2, padx=5, pady=10, sticky=tk.NE)
+        
+    def create_extrema_tab(self):
+        # Функция
+        ttk.Label(self.extrema_tab, text="f(x):").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
+        ttk.Label(self.extrema_tab, text=self.extrema_formula, wraplength=400).grid(
+            row=0, column=1, columnspan=2, padx=5, pady=5, sticky=tk.W
+        )
+        
+        # Интервал поиска
+        ttk.Label(self.extrema_tab, text="Интервал поиска [a, b]:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
+        self.extrema_a_entry = ttk.Entry(self.extrema_tab, width=15)
+        self.extrema_a_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
+        ttk.Label(self.extrema_tab, text=",").grid(row=1, column=1, padx=5, pady=5)
+        self.extrema_b_entry = ttk.Entry(self.extrema_tab, width=15)
+        self.extrema_b_entry.grid(row=1, column=2, padx=5, pady=5, sticky=tk.W)
+        
+        # Точность
+        ttk.Label(self.extrema_tab, text="Точность ε:").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
+        self.extrema_epsilon_entry = ttk.Entry(self.extrema_tab, width=15)
+        self.extrema_epsilon_entry.insert(0, "0.0001")
+        self.extrema_epsilon_entry.grid(row=2, column=1, padx=5, pady=5, sticky=tk.W)
+        
+        # Глобальный поиск по подотрезкам
+        global_frame = ttk.Frame(self.extrema_tab)
+        global_frame.grid(row=2, column=2, padx=5, pady=5, sticky=tk.W)
+        self.global_search_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(global_frame, text="Глобальный поиск, частей:", variable=self.global_search_var).pack(
+            side=tk.LEFT)
+        self.global_parts_var = tk.IntVar(value=16)
+        ttk.Spinbox(global_frame, from_=1, to=1024, textvariable=self.global_parts_var, width=6).pack(
+            side=tk.LEFT, padx=5)
+        
+        # Метод
+        extrema_method_frame = ttk.Frame(self.extrema_tab)
+        extrema_method_frame.grid(row=3, column=0, padx=5, pady=10, sticky=tk.W)
+        ttk.Label(extrema_method_frame, text="Метод:").pack(side=tk.LEFT)
+        self.extrema_method_var = tk.StringVar(value='Парабол')
+        ttk.Combobox(extrema_method_frame, textvariable=self.extrema_method_var, values=list(EXTREMUM_METHODS),
+                     width=10, state='readonly').pack(side=tk.LEFT, padx=5)
+        self.extrema_profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(extrema_method_frame, text="Профилирование", variable=self.extrema_profile_var).pack(
+            side=tk.LEFT, padx=5)
+        
+        # Кнопка решения
+        solve_extrema_btn = ttk.Button(self.extrema_tab, text="Найти экстремум", command=self.solve_extrema_parabolic)
+        solve_extrema_btn.grid(row=3, column=1, padx=5, pady=10)
+        self.extrema_task = TaskPanel(self.extrema_tab, SolverCancelled)
+        self.extrema_task.grid(row=3, column=2, padx=5, pady=10, sticky=tk.W)
+        
+        # График (уменьшенный размер)
+        self.fig_extrema = plt.Figure(figsize=(8, 5))
+        self.ax_extrema = self.fig_extrema.add_subplot(111)
+        self.canvas_extrema = FigureCanvasTkAgg(self.fig_extrema, self.extrema_tab)
+        self.canvas_extrema.get_tk_widget().grid(row=4, column=0, columnspan=3, padx=5, pady=5)
+        
+        # Масштаб
+        toolbar_frame_extrema = ttk.Frame(self.extrema_tab)
+        toolbar_frame_extrema.grid(row=5, column=0, columnspan=3)
+        self.toolbar_extrema = NavigationToolbar2Tk(self.canvas_extrema, toolbar_frame_extrema)
+        self.toolbar_extrema.update()
+        
+        # Результаты
+        results_frame_extrema = ttk.LabelFrame(self.extrema_tab, text="Результаты", padding=10)
+        results_frame_extrema.grid(row=6, column=0, columnspan=3, padx=5, pady=10, sticky="ew")
+        
+        # Текстовое поле для итераций (уменьшенная высота)
+        ttk.Label(results_frame_extrema, text="Итерационная последовательность:").grid(row=0, column=0, sticky=tk.W)
+        self.extrema_iterations_log = IterationLog(results_frame_extrema, height=8, width=80)
+        self.extrema_iterations_log.grid(row=1, column=0, columnspan=3, sticky="ew")
+        
+        # Результат
+        self.extrema_result_label = ttk.Label(results_frame_extrema, text="", wraplength=600)
+        self.extrema_result_label.grid(row=2, column=0, columnspan=2, pady=10, sticky=tk.W)
+        ttk.Button(results_frame_extrema, text="Профиль в JSON",
+                   command=lambda: self.export_profile('extrema')).grid(row=2, column=2, padx=5, pady=10, sticky=tk.NE)
+
+    def plot_analytical(self):
+        try:
+            formula = self.formula_entry.get().strip()
+            x_min_str = self.x_min.get().strip()
+            x_max_str = self.x_max.get().strip()
+
+            if not formula:
+                raise ValueError("Введите формулу")
+            if not x_min_str or not x_max_str:
+                raise ValueError("Заполните диапазон X")
+
+            x_min = float(x_min_str)
+            x_max = float(x_max_str)
+
+            if x_min >= x_max:
+                raise ValueError("X min должно быть меньше X max")
+
+            # Размер области графика в пикселях задает точность адаптивной выборки
+            bbox = self.ax_analytical.get_window_extent()
+            x_vals, y_vals = adaptive_sample(formula, x_min, x_max, bbox.width, bbox.height)
+
+            self.ax_analytical.clear()
+
+            self.ax_analytical.plot(x_vals, y_vals, label=formula)
+            self.ax_analytical.set_title("График аналитической функции")
+            self.ax_analytical.set_xlabel("X")
+            self.ax_analytical.set_ylabel("Y")
+            self.ax_analytical.grid(True)
+            self.ax_analytical.legend()
+
+            # Около полюсов значения огромны — ограничиваем ось Y основной частью графика
+            # (квантили считаются по равномерной сетке: адаптивные точки сгущены у полюсов)
+            finite = y_vals[np.isfinite(y_vals)]
+            uniform = sample_function(formula, np.linspace(x_min, x_max, 1000))
+            uniform = uniform[np.isfinite(uniform)]
+            if finite.size and uniform.size:
+                y_low, y_high = np.percentile(uniform, [2, 98])
+                span = y_high - y_low
+                if span > 0 and finite.max() - finite.min() > 10 * span:
+                    self.ax_analytical.set_ylim(y_low - 0.2 * span, y_high + 0.2 * span)
+
+            self.canvas_analytical.draw()
+
+        except Exception as e:
+            tk.messagebox.showerror("Ошибка", str(e))
+            
+    def plot_tabular(self):
+        try:
+            file_path = filedialog.askopenfilename(
+                title="Выберите csv файл",
+                filetypes=[("CSV Files", "*.csv"), ("NumPy Files", "*.npy"), ("All Files", "*.*")],
+            )
+
+            if not file_path:
+                return
+            
+            columns = (self.x_column_var.get() - 1, self.y_column_var.get() - 1)
+            if min(columns) < 0:
+                raise ValueError("Номера столбцов начинаются с 1")
+            x_vals, y_vals = load_table_cached(file_path, columns=columns, header=self.header_var.get())
+
+            self.ax_tabular.clear()
+
+            self.tabular_line = DecimatedLine(self.ax_tabular, x_vals, y_vals,
+                                              marker='o', label='Табличная функция')
+            self.ax_tabular.set_title("Табличная функция")
+            self.ax_tabular.set_xlabel("X")
+            self.ax_tabular.set_ylabel("Y")
+            self.ax_tabular.grid(True)
+            self.ax_tabular.legend()
+
+            self.canvas_tabular.draw()
+            
+            self.file_path_label.config(text=file_path)
+            
+        except Exception as e:
+            tk.messagebox.showerror("Ошибка", str(e))
+    
+    def evaluate_function(self, formula, x_val):
+        # Точки запоминаются, чтобы график и повторные решения не считали их заново
+        return POINT_CACHE.evaluate(formula, x_val)
+    
+    def solve_dichotomy(self):
+        try:
+            formula = self.dichotomy_formula_entry.get().strip()
+            a_str = self.a_entry.get().strip()
+            b_str = self.b_entry.get().strip()
+            epsilon_str = self.epsilon_entry.get().strip()
+            
+            if not formula:
+                raise ValueError("Введите функцию")
+            if not a_str or not b_str:
+                raise ValueError("Введите границы интервала")
+            if not epsilon_str:
+                raise ValueError("Введите точность")
+        
+            a = float(a_str)
+            b = float(b_str)
+            epsilon = float(epsilon_str)
+            
+            if a >= b:
+                raise ValueError("a должно быть меньше b")
+            
+            compile_formula(formula)
+            
+        except Exception as e:
+            messagebox.showerror("Ошибка", str(e))
+            return
+        
+        instrumentation = Instrumentation(self.profile_var.get(), POINT_CACHE)
+        
+        if self.all_roots_var.get():
+            # Поиск всех корней сразу
+            def work_all(progress):
+                with instrumentation.phase('solve'):
+                    return find_all_roots(formula, a, b, epsilon,
+                                          progress=instrumentation.wrap_progress(progress))
+            
+            def done_all(result):
+                with instrumentation.phase('display'):
+                    self.display_all_roots(result)
+                with instrumentation.phase('plot'):
+                    self.plot_dichotomy_graph(formula, result['roots'], a, b)
+                self.show_profile('dichotomy', instrumentation, self.result_label)
+            
+            self.dichotomy_task.run(work_all, done_all)
+            return
+        
+        method, method_title = ROOT_METHODS[self.root_method_var.get()]
+        func = instrumentation.wrap(lambda x: self.evaluate_function(formula, x))
+        
+        # Уточнение корня считается в фоновом потоке, итерации приходят по мере вычисления
+        def work(progress):
+            with instrumentation.phase('solve'):
+                return method(func, a, b, epsilon, instrumentation.wrap_progress(progress),
+                              on_record=self.dichotomy_task.publish)
+        
+        def update(records):
+            self.iterations_log.append_records(records)
+            self.show_bracket(self.ax_dichotomy, self.canvas_dichotomy, records[-1]['a'], records[-1]['b'])
+        
+        def done(result):
+            # Отображение результатов
+            with instrumentation.phase('display'):
+                self.display_iterations(result['iterations'], result['root'], result['f_root'],
+                                        len(result['iterations']), result['evaluations'])
+            
+            # Построение графика
+            with instrumentation.phase('plot'):
+                self.plot_dichotomy_graph(formula, result['root'], a, b, method_title)
+            self.show_profile('dichotomy', instrumentation, self.result_label)
+        
+        if not self.dichotomy_task.run(work, done, on_update=update):
+            return
+        
+        # Журнал и график готовятся, пока решатель считает: строки придут при первом опросе
+        self.iterations_log.set_records(ROOT_LOG_HEADER, [], format_root_record)
+        self.plot_dichotomy_graph(formula, [], a, b, method_title)
+    
+    def display_iterations(self, iterations, root, f_root, iteration_count, evaluations=None):
+        """Отображает результаты итераций"""
+        self.iterations_log.set_records(ROOT_LOG_HEADER, iterations, format_root_record)
+        
+        result_text = (f"\nРезультат:\n"
+                      f"Корень: x = {root:.6f}\n"
+                      f"Значение функции в корне: f(x) = {f_root:.6e}\n"
+                      f"Количество итераций: {iteration_count}")
+        if evaluations is not None:
+            result_text += f"\nВычислений функции: {evaluations}"
+        
+        self.result_label.config(text=result_text)
+    
+    def display_all_roots(self, result):
+        """Отображает таблицу всех найденных корней"""
+        header = f"{'№':<5} {'x':<20} {'f(x)':<14}\n" + "-" * 45 + "\n"
+        records = [{'index': i + 1, 'x': x, 'f': f}
+                   for i, (x, f) in enumerate(zip(result['roots'], result['f_roots']))]
+        
+        def format_row(record):
+            return f"{record['index']:<5} {record['x']:<20.12f} {record['f']:<14.6e}\n"
+        
+        self.iterations_log.set_records(header, records, format_row)
+        
+        result_text = (f"\nРезультат:\n"
+                      f"Найдено корней: {len(records)}\n"
+                      f"Векторных шагов дихотомии: {result['steps']}")
+        
+        self.result_label.config(text=result_text)
+    
+    def show_profile(self, tab, instrumentation, label):
+        """Дописывает отчет профилирования к результату и запоминает его для экспорта"""
+        if not instrumentation.enabled:
+            self.profiles.pop(tab, None)
+            return
+        self.profiles[tab] = instrumentation
+        label.config(text=label.cget('text') + "\n\n" + instrumentation.report())
+    
+    def show_bracket(self, ax, canvas, lo, hi):
+        """Закрашивает на графике текущий отрезок решателя"""
+        span = self.bracket_spans.get(ax)
+        if span is not None and span in ax.patches:
+            span.remove()
+        self.bracket_spans[ax] = ax.axvspan(lo, hi, color='orange', alpha=0.25)
+        canvas.draw_idle()
+    
+    def export_profile(self, tab):
+        """Сохраняет последние замеры вкладки в JSON"""
+        instrumentation = self.profiles.get(tab)
+        if instrumentation is None:
+            messagebox.showwarning("Профиль", "Сначала выполните решение с включенным профилированием")
+            return
+        
+        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not file_path:
+            return
+        try:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(instrumentation.to_dict(), f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            messagebox.showerror("Ошибка", f"Не удалось сохранить профиль:\n{e}")
+    
+    def plot_dichotomy_graph(self, formula, root, original_a, original_b, method_title='методом дихотомии'):
+        """Строит график функции с найденным корнем (или массивом корней)"""
+        try:
+            # Расширяем интервал для лучшей визуализации
+            margin = abs(original_b - original_a) * 0.2
+            x_min = original_a - margin
+            x_max = original_b + margin
+            
+            x_vals = np.linspace(x_min, x_max, PREVIEW_POINTS)
+            y_vals = sample_function(formula, x_vals)
+            
+            self.ax_dichotomy.clear()
+            
+            # График функции
+            self.ax_dichotomy.plot(x_vals, y_vals, 'b-', label=f'f(x) = {formula}', linewidth=2)
+            
+            # Ось x
+            self.ax_dichotomy.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+            
+            # Найденные корни
+            roots = np.atleast_1d(np.asarray(root, dtype=float))
+            if roots.size == 1:
+                # Значение в корне уже посчитал решатель, оно берется из кэша
+                f_roots = [self.evaluate_function(formula, roots[0])]
+            else:
+                f_roots = sample_function(formula, roots)
+            if roots.size:
+                label = f'Корень: x = {roots[0]:.6f}' if len(roots) == 1 else f'Корни: {len(roots)}'
+                self.ax_dichotomy.plot(roots, f_roots, 'ro', markersize=8, label=label)
+            
+            # Исходный интервал
+            self.ax_dichotomy.axvline(x=original_a, color='g', linestyle='--', alpha=0.7, label=f'Интервал [{original_a:.2f}, {original_b:.2f}]')
+            self.ax_dichotomy.axvline(x=original_b, color='g', linestyle='--', alpha=0.7)
+            
+            self.ax_dichotomy.set_title(f"Решение уравнения {formula} = 0 {method_title}")
+            self.ax_dichotomy.set_xlabel("x")
+            self.ax_dichotomy.set_ylabel("f(x)")
+            self.ax_dichotomy.grid(True, alpha=0.3)
+            self.ax_dichotomy.legend()
+            
+            self.canvas_dichotomy.draw()
+            
+        except Exception as e:
+            messagebox.showerror("Ошибка построения графика", str(e))
+        
+    def find_extrema_points(self):
+        """Локализация всех экстремумов с уточнением до точности ε"""
+        try:
+            formula = self.formula_entry.get().strip()
+            x_min_str = self.x_min.get().strip()
+            x_max_str = self.x_max.get().strip()
+            epsilon_str = self.extrema_scan_epsilon_entry.get().strip()
+
+            if not formula or not x_min_str or not x_max_str or not epsilon_str:
+                raise ValueError("Заполните все поля")
+
+            x_min = float(x_min_str)
+            x_max = float(x_max_str)
+            epsilon = float(epsilon_str)
+            
+            if x_min >= x_max:
+                raise ValueError("Минимум диапазона должен быть меньше максимума")
+            if epsilon <= 0:
+                raise ValueError("Точность должна быть положительной")
+            
+            compile_formula(formula)
+            
+            # Поиск и уточнение сразу всех экстремумов
+            extrema = find_all_extrema(formula, x_min, x_max, epsilon)
+            minima = extrema['is_minimum']
+            
+            # Перестроение графика с отмеченными экстремумами
+            x_vals = np.linspace(x_min, x_max, PREVIEW_POINTS)
+            y_vals = sample_function(formula, x_vals)
+            self.ax_analytical.clear()
+            DecimatedLine(self.ax_analytical, x_vals, y_vals, label=formula)
+            
+            # Отметка экстремумов: по одной серии на тип
+            self.ax_analytical.plot(extrema['x'][~minima], extrema['f'][~minima], linestyle='None', marker='^',
+                                    color='red', markersize=10, label=f'Максимумы: {np.count_nonzero(~minima)}')
+            self.ax_analytical.plot(extrema['x'][minima], extrema['f'][minima], linestyle='None', marker='v',
+                                    color='blue', markersize=10, label=f'Минимумы: {np.count_nonzero(minima)}')
+            
+            self.ax_analytical.set_title("График с локализованными экстремумами")
+            self.ax_analytical.set_xlabel("X")
+            self.ax_analytical.set_ylabel("Y")
+            self.ax_analytical.grid(True)
+            self.ax_analytical.legend()
+            self.canvas_analytical.draw()
+            
+            # Вывод результатов в текстовое поле
+            self.extrema_results_text.delete(1.0, tk.END)
+            if extrema['x'].size:
+                lines = [f"Найдено экстремумов: {extrema['x'].size} "
+                         f"(векторных шагов уточнения: {extrema['steps']})\n\n"]
+                for i, (x_ext, y_ext, is_min) in enumerate(zip(extrema['x'], extrema['f'], minima)):
+                    ext_name = "Минимум" if is_min else "Максимум"
+                    lines.append(f"{i+1}. {ext_name}: x = {x_ext:.10f}, f(x) = {y_ext:.10f}\n")
+                result_text = "".join(lines)
+            else:
+                result_text = "Экстремумы не найдены в заданном диапазоне"
+            
+            self.extrema_results_text.insert(1.0, result_text)
+            
+        except Exception as e:
+            messagebox.showerror("Ошибка", str(e))
+
+    def numerical_derivative(self, formula, x, h=1e-8):
+        """Численное дифференцирование"""
+        return numerical_derivative(POINT_CACHE.function(formula), x, h)
+
+    def numerical_second_derivative(self, formula, x, h=1e-6):
+        """Численная вторая производная"""
+        return numerical_second_derivative(POINT_CACHE.function(formula), x, h)
+
+    def solve_extrema_parabolic(self):
+        try:
+            formula = self.extrema_formula
+            a_str = self.extrema_a_entry.get().strip()
+            b_str = self.extrema_b_entry.get().strip()
+            epsilon_str = self.extrema_epsilon_entry.get().strip()
+            
+            if not a_str or not b_str or not epsilon_str:
+                raise ValueError("Заполните границы интервала и точность")
+        
+            a = float(a_str)
+            b = float(b_str)
+            epsilon = float(epsilon_str)
+            
+            if a >= b:
+                raise ValueError("a должно быть меньше b")
+            
+            global_search = self.global_search_var.get()
+            if global_search:
+                parts = int(self.global_parts_var.get())
+                if parts < 1:
+                    raise ValueError("Число частей должно быть положительным")
+            
+        except Exception as e:
+            messagebox.showerror("Ошибка", str(e))
+            return
+        
+        method_name = self.extrema_method_var.get()
+        method, method_title = EXTREMUM_METHODS[method_name]
+        instrumentation = Instrumentation(self.extrema_profile_var.get(), POINT_CACHE)
+        
+        if global_search:
+            # Подотрезки решаются в пуле процессов, поток интерфейса только ждет результат
+            def work_global(progress):
+                with instrumentation.phase('solve'):
+                    return multistart_extrema(formula, a, b, epsilon, parts, method_name, progress)
+            
+            def done_global(result):
+                with instrumentation.phase('display'):
+                    self.display_global_extrema(result, parts)
+                with instrumentation.phase('plot'):
+                    self.plot_global_extrema(formula, result, a, b, method_title)
+                self.show_profile('extrema', instrumentation, self.extrema_result_label)
+            
+            self.extrema_task.run(work_global, done_global)
+            return
+        
+        func = instrumentation.wrap(lambda x: self.evaluate_function(formula, x))
+        
+        # Поиск минимума и производные считаются в фоновом потоке, итерации приходят по мере вычисления
+        def work(progress):
+            result = solve_extremum(func, a, b, epsilon, progress, instrumentation, method,
+                                    on_record=self.extrema_task.publish)
+            
+            # Для сравнения остальные методы решают ту же задачу мимо кэша точек,
+            # чтобы учитывались все их вычисления функции
+            result['comparison'] = {method_name: result['evaluations']}
+            with instrumentation.phase('comparison'):
+                for name, (other_method, _) in EXTREMUM_METHODS.items():
+                    if name != method_name:
+                        counted = CountingFunction(compile_formula(formula))
+                        other_method(counted, a, b, epsilon, progress)
+                        result['comparison'][name] = counted.count
+            return result
+        
+        def done(result):
+            second_derivative = result['second_derivative']
+            if second_derivative is not None:
+                if second_derivative > 0:
+                    extremum_type = "Минимум"
+                elif second_derivative < 0:
+                    extremum_type = "Максимум"
+                else:
+                    extremum_type = "Неопределенный"
+            else:
+                extremum_type = "Неопределенный"
+            
+            with instrumentation.phase('display'):
+                self.display_extrema_iterations(result['iterations'], result['x'], result['f'],
+                                              result['first_derivative'], second_derivative,
+                                              extremum_type, len(result['iterations']),
+                                              result['evaluations'], result['comparison'])
+            
+            with instrumentation.phase('plot'):
+                self.plot_extrema_graph(formula, result['x'], a, b, method_title)
+            self.show_profile('extrema', instrumentation, self.extrema_result_label)
+        
+        def update(records):
+            self.extrema_iterations_log.append_records(records)
+            self.show_bracket(self.ax_extrema, self.canvas_extrema, records[-1]['x1'], records[-1]['x3'])
+        
+        if not self.extrema_task.run(work, done, on_update=update):
+            return
+        
+        # Журнал и график готовятся, пока решатель считает: строки придут при первом опросе
+        self.extrema_iterations_log.set_records(EXTREMUM_LOG_HEADER, [], format_extremum_record)
+        self.plot_extrema_graph(formula, None, a, b, method_title)
+
+    def display_extrema_iterations(self, iterations, extremum_x, extremum_f, 
+                                 first_deriv, second_deriv, extremum_type, iteration_count,
+                                 evaluations=None, comparison=None):
+        self.extrema_iterations_log.set_records(EXTREMUM_LOG_HEADER, iterations, format_extremum_record)
+        
+        result_text = (f"\nРезультат:\n"
+                      f"Точка экстремума: x = {extremum_x:.6f}\n"
+                      f"Значение функции: f(x) = {extremum_f:.6f}\n"
+                      f"Тип экстремума: {extremum_type}\n"
+                      f"Количество итераций: {iteration_count}")
+        
+        if first_deriv is not None:
+            result_text += f"\nПервая производная: f'(x) = {first_deriv:.6e}"
+        if second_deriv is not None:
+            result_text += f"\nВторая производная: f''(x) = {second_deriv:.6e}"
+        if evaluations is not None:
+            result_text += f"\nВычислений функции: {evaluations}"
+        if comparison:
+            result_text += "\nСравнение методов (вычислений функции): " + ", ".join(
+                f"{name} {count}" for name, count in comparison.items())
+        
+        self.extrema_result_label.config(text=result_text)
+
+    def display_global_extrema(self, result, parts):
+        """Таблица экстремумов глобального поиска, глобальные минимум и максимум, время"""
+        header = f"{'№':<5} {'x':<20} {'f(x)':<20} {'Тип':<10}\n" + "-" * 60 + "\n"
+        records = [dict(extremum, index=i + 1) for i, extremum in enumerate(result['extrema'])]
+        
+        def format_row(record):
+            ext_name = "Минимум" if record['is_minimum'] else "Максимум"
+            return f"{record['index']:<5} {record['x']:<20.12f} {record['f']:<20.12f} {ext_name:<10}\n"
+        
+        self.extrema_iterations_log.set_records(header, records, format_row)
+        
+        result_text = (f"\nРезультат глобального поиска:\n"
+                       f"Найдено экстремумов: {len(records)}")
+        if result['minimum'] is not None:
+            result_text += (f"\nГлобальный минимум: f(x) = {result['minimum']['f']:.6f} "
+                            f"при x = {result['minimum']['x']:.6f}"
+                            f"\nГлобальный максимум: f(x) = {result['maximum']['f']:.6f} "
+                            f"при x = {result['maximum']['x']:.6f}")
+        
+        speedup = result['task_time'] / result['wall_time'] if result['wall_time'] else 0.0
+        result_text += (f"\nПодотрезков: {parts}, задач: {result['tasks']}, процессов: {result['workers']}"
+                        f"\nВычислений функции: {result['evaluations']}"
+                        f"\nВремя: {result['wall_time'] * 1000:.1f} мс "
+                        f"(сумма по задачам {result['task_time'] * 1000:.1f} мс, ускорение {speedup:.1f}×)")
+        
+        self.extrema_result_label.config(text=result_text)
+
+    def plot_global_extrema(self, formula, result, original_a, original_b, method_title):
+        try:
+            margin = abs(original_b - original_a) * 0.2
+            x_vals = np.linspace(original_a - margin, original_b + margin, PREVIEW_POINTS)
+            y_vals = sample_function(formula, x_vals)
+            
+            self.ax_extrema.clear()
+            self.ax_extrema.plot(x_vals, y_vals, 'b-', label=f'f(x) = {formula}', linewidth=2)
+            
+            extrema = result['extrema']
+            minima = [e for e in extrema if e['is_minimum']]
+            maxima = [e for e in extrema if not e['is_minimum']]
+            self.ax_extrema.plot([e['x'] for e in minima], [e['f'] for e in minima], linestyle='None',
+                                 marker='v', color='red', markersize=8, label=f'Минимумы: {len(minima)}')
+            self.ax_extrema.plot([e['x'] for e in maxima], [e['f'] for e in maxima], linestyle='None',
+                                 marker='^', color='green', markersize=8, label=f'Максимумы: {len(maxima)}')
+            
+            if result['minimum'] is not None:
+                self.ax_extrema.plot(result['minimum']['x'], result['minimum']['f'], marker='*', color='red',
+                                     markersize=16, linestyle='None', label='Глобальный минимум')
+                self.ax_extrema.plot(result['maximum']['x'], result['maximum']['f'], marker='*', color='green',
+                                     markersize=16, linestyle='None', label='Глобальный максимум')
+            
+            self.ax_extrema.axvline(x=original_a, color='gray', linestyle='--', alpha=0.7, 
+                                  label=f'Интервал [{original_a:.2f}, {original_b:.2f}]')
+            self.ax_extrema.axvline(x=original_b, color='gray', linestyle='--', alpha=0.7)
+            
+            self.ax_extrema.set_title(f"Глобальный поиск экстремумов функции {formula} {method_title}")
+            self.ax_extrema.set_xlabel("x")
+            self.ax_extrema.set_ylabel("f(x)")
+            self.ax_extrema.grid(True, alpha=0.3)
+            self.ax_extrema.legend()
+            
+            self.canvas_extrema.draw()
+            
+        except Exception as e:
+            messagebox.showerror("Ошибка построения графика", str(e))
+
+    def plot_extrema_graph(self, formula, extremum_x, original_a, original_b, method_title='методом парабол'):
+        try:
+            margin = abs(original_b - original_a) * 0.2
+            x_min = original_a - margin
+            x_max = original_b + margin
+            
+            x_vals = np.linspace(x_min, x_max, PREVIEW_POINTS)
+            y_vals = sample_function(formula, x_vals)
+            
+            self.ax_extrema.clear()
+            
+            self.ax_extrema.plot(x_vals, y_vals, 'b-', label=f'f(x) = {formula}', linewidth=2)
+            
+            # Без точки экстремума рисуется только кривая — перед запуском решателя
+            if extremum_x is not None:
+                f_extremum = self.evaluate_function(formula, extremum_x)
+                second_deriv = self.numerical_second_derivative(formula, extremum_x)
+                
+                if second_deriv is not None and second_deriv > 0:
+                    color, marker, label_type = 'red', 'v', 'Минимум'
+                elif second_deriv is not None and second_deriv < 0:
+                    color, marker, label_type = 'green', '^', 'Максимум'
+                else:
+                    color, marker, label_type = 'orange', 'o', 'Экстремум'
+                    
+                self.ax_extrema.plot(extremum_x, f_extremum, marker=marker, color=color, 
+                                   markersize=10, label=f'{label_type}: x = {extremum_x:.6f}')
+            
+            self.ax_extrema.axvline(x=original_a, color='gray', linestyle='--', alpha=0.7, 
+                                  label=f'Интервал [{original_a:.2f}, {original_b:.2f}]')
+            self.ax_extrema.axvline(x=original_b, color='gray', linestyle='--', alpha=0.7)
+            
+            self.ax_extrema.set_title(f"Поиск экстремума функции {formula} {method_title}")
+            self.ax_extrema.set_xlabel("x")
+            self.ax_extrema.set_ylabel("f(x)")
+            self.ax_extrema.grid(True, alpha=0.3)
+            self.ax_extrema.legend()
+            
+            self.canvas_extrema.draw()
+            
+        except Exception as e:
+            messagebox.showerror("Ошибка построения графика", str(e))
+
+
+def run():
+    root = tk.Tk()
+    app = GraphApp(root)
+    close_on_delete(root)
+    root.mainloop()
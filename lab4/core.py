@@ -0,0 +1,914 @@
+"""Решатели СЛАУ без графического интерфейса: LU-разложение (плотное, ленточное,
+прогонка) и метод Зейделя"""
+
+import hashlib
+import threading
+from collections import OrderedDict, deque
+
+import numpy as np
+
+
+# Ведущий элемент меньше этого порога считается нулевым
+PIVOT_TOLERANCE = 1e-10
+# Ширина панели столбцов в блочном LU-разложении
+LU_BLOCK = 64
+# Строк за один шаг отложенного обновления: ограничивает временный массив
+LU_UPDATE_ROWS = 256
+# Шаг, с которым ленточные методы сообщают о ходе вычисления
+BAND_PROGRESS_STEP = 1024
+# До этой полуширины ленты столбец обрабатывается скалярным циклом: вызовы numpy
+# на столбец обходятся дороже самой работы O(k²)
+BAND_SCALAR_WIDTH = 8
+# Рост элементов при ленточном разложении без перестановок (max|L|, |U| к max|A|),
+# выше которого точность не гарантирована и система решается плотным LU
+BAND_GROWTH_LIMIT = 1e3
+# Наибольший размер ленты (2k+1)·n для разреженного LU, чисел float64
+SPARSE_BAND_LIMIT = 50_000_000
+# Подбор ω: не меньше OMEGA_PROBE_SWEEPS проходов с ω = 1; скорость сходимости берется
+# по последним OMEGA_RATE_WINDOW отношениям поправок, когда их разброс не больше
+# OMEGA_RATE_TOLERANCE. ω не больше OMEGA_MAX; после переключения поправки сверяются
+# каждые OMEGA_CHECK_SWEEPS проходов, и если они не убывают, метод возвращается к ω = 1
+OMEGA_PROBE_SWEEPS = 8
+OMEGA_RATE_WINDOW = 4
+OMEGA_RATE_TOLERANCE = 0.01
+OMEGA_MAX = 1.9
+OMEGA_CHECK_SWEEPS = 64
+
+
+class SolverCancelled(Exception):
+    """Вычисление остановлено пользователем"""
+
+
+class LUSolver:    
+    #упакованное разложение LU с выбором ведущего элемента по столбцу: PA = LU
+    @staticmethod
+    def lu_factor(A, progress=None, block=LU_BLOCK, overwrite=False):
+        """Возвращает массив LU с множителями L под диагональю (единичная диагональ L
+        не хранится) и U на диагонали и выше, и перестановку строк perm
+        (строка i матрицы PA — это A[perm[i]]).
+
+        Столбцы обрабатываются панелями по block штук: внутри панели — ранг-1
+        обновления, остаток матрицы обновляется один раз на панель умножением матриц.
+        При overwrite=True массив float64 A перезаписывается разложением без копии.
+        """
+        LU = np.asarray(A, dtype=float) if overwrite else np.array(A, dtype=float)
+        n = len(LU)
+        perm = np.arange(n)
+        
+        for k0 in range(0, n, block):
+            k1 = min(k0 + block, n)
+            
+            for k in range(k0, k1):
+                # ведущий элемент — наибольший по модулю в оставшейся части столбца
+                p = k + int(np.argmax(np.abs(LU[k:, k])))
+                if abs(LU[p, k]) < PIVOT_TOLERANCE:
+                    raise ValueError("Матрица вырождена")
+                if p != k:
+                    LU[[k, p]] = LU[[p, k]]
+                    perm[[k, p]] = perm[[p, k]]
+                
+                # столбец L и ранг-1 обновление внутри панели
+                LU[k + 1:, k] /= LU[k, k]
+                LU[k + 1:, k + 1:k1] -= np.outer(LU[k + 1:, k], LU[k, k + 1:k1])
+                
+                if progress:
+                    progress(k + 1, n)
+            
+            if k1 < n:
+                # строки U правее панели и отложенное обновление оставшейся подматрицы
+                L11 = np.tril(LU[k0:k1, k0:k1], -1) + np.eye(k1 - k0)
+                LU[k0:k1, k1:] = np.linalg.solve(L11, LU[k0:k1, k1:])
+                for r0 in range(k1, n, LU_UPDATE_ROWS):
+                    r1 = min(r0 + LU_UPDATE_ROWS, n)
+                    LU[r0:r1, k1:] -= LU[r0:r1, k0:k1] @ LU[k0:k1, k1:]
+        
+        return LU, perm
+    
+    #распаковка L и U из упакованного разложения (для вывода)
+    @staticmethod
+    def unpack(LU):
+        L = np.tril(LU, -1)
+        np.fill_diagonal(L, 1.0)
+        return L, np.triu(LU)
+    
+    #разложение LU: отдельные матрицы L и U
+    @staticmethod
+    def lu_decomposition(A, progress=None):
+        LU, perm = LUSolver.lu_factor(A, progress)
+        L, U = LUSolver.unpack(LU)
+        return L, U, perm
+    
+    #прямая подстановка (b — вектор или матрица правых частей по столбцам);
+    #используется только часть L под диагональю, поэтому подходит и упакованный LU
+    @staticmethod
+    def forward_substitution(L, b, block=LU_BLOCK):
+        L = np.asarray(L, dtype=float)
+        y = np.array(b, dtype=float)
+        
+        # вклад уже найденных блоков — одним умножением, внутри блока — построчно
+        for i0 in range(0, len(y), block):
+            i1 = min(i0 + block, len(y))
+            y[i0:i1] -= L[i0:i1, :i0] @ y[:i0]
+            for i in range(i0 + 1, i1):
+                y[i] -= L[i, i0:i] @ y[i0:i]
+        
+        return y
+    
+    #обратная подстановка; используется только U на диагонали и выше
+    @staticmethod
+    def backward_substitution(U, y, block=LU_BLOCK):
+        U = np.asarray(U, dtype=float)
+        x = np.array(y, dtype=float)
+        
+        for i1 in range(len(x), 0, -block):
+            i0 = max(i1 - block, 0)
+            x[i0:i1] -= U[i0:i1, i1:] @ x[i1:]
+            for i in range(i1 - 1, i0 - 1, -1):
+                if abs(U[i, i]) < PIVOT_TOLERANCE:
+                    raise ValueError("Деление на ноль")
+                x[i] = (x[i] - U[i, i + 1:i1] @ x[i + 1:i1]) / U[i, i]
+        
+        return x
+    
+    #решение системы; разложение A берется из кэша, если матрица уже встречалась.
+    #Возвращает упакованный LU: отдельные L и U собирает unpack, когда их нужно показать
+    @staticmethod
+    def solve(A, b, progress=None):
+        factorization = LU_CACHE.factorize(A, progress)
+        return factorization.solve(b), factorization.LU, factorization.perm
+    
+    #выч невязки
+    @staticmethod
+    def calculate_residual(A, x, b):
+        if not isinstance(A, CSRMatrix):
+            A = np.asarray(A, dtype=float)
+        return A @ np.asarray(x, dtype=float) - np.asarray(b, dtype=float)
+    
+    #норма невязки
+    @staticmethod
+    def residual_norm(residual):
+        return float(np.linalg.norm(residual))
+
+
+class LUFactorization:
+    """LU-разложение PA = LU, посчитанное один раз для многих правых частей.
+
+    L и U хранятся упакованными в одном массиве LU, отдельно они собираются
+    только через unpack — для вывода.
+    """
+    def __init__(self, A, progress=None, overwrite=False):
+        self.LU, self.perm = LUSolver.lu_factor(A, progress, overwrite=overwrite)
+
+    def unpack(self):
+        return LUSolver.unpack(self.LU)
+
+    def solve(self, B):
+        """Решает AX = B; B — вектор или матрица, столбцы которой — правые части"""
+        Y = LUSolver.forward_substitution(self.LU, np.asarray(B, dtype=float)[self.perm])
+        return LUSolver.backward_substitution(self.LU, Y)
+
+
+class FactorizationCache:
+    """Ограниченный LRU-кэш LU-разложений по хешу матрицы со статистикой попаданий.
+
+    Повторное решение с той же матрицей и новой правой частью пропускает
+    разложение за O(n³) и стоит только подстановок за O(n²).
+    """
+    def __init__(self, maxsize=4):
+        self.maxsize = maxsize
+        self.factorizations = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(A):
+        A = np.ascontiguousarray(A, dtype=float)
+        digest = hashlib.sha1(str(A.shape).encode())
+        digest.update(memoryview(A))
+        return digest.hexdigest()
+
+    def factorize(self, A, progress=None):
+        array = np.ascontiguousarray(A, dtype=float)
+        key = self.key(array)
+        with self.lock:
+            if key in self.factorizations:
+                self.hits += 1
+                self.factorizations.move_to_end(key)
+                return self.factorizations[key]
+            self.misses += 1
+
+        # Разлагаем вне блокировки: это самая долгая часть решения. Если array —
+        # уже наша копия A, разложение записывается прямо в нее
+        factorization = LUFactorization(array, progress, overwrite=array is not A)
+
+        with self.lock:
+            self.factorizations[key] = factorization
+            self.factorizations.move_to_end(key)
+            if len(self.factorizations) > self.maxsize:
+                self.factorizations.popitem(last=False)
+        return factorization
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self.factorizations),
+                    'maxsize': self.maxsize, 'hit_rate': self.hits / total if total else 0.0}
+
+    def clear(self):
+        with self.lock:
+            self.factorizations.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Кэш разложений, общий для всех решений LU-методом
+LU_CACHE = FactorizationCache()
+
+
+class BandedLUSolver:
+    """LU-разложение ленточной матрицы без выбора ведущего элемента.
+
+    Матрица с полушириной ленты k хранится по диагоналям в массиве (2k+1)×n:
+    bands[k + i - j, j] = A[i][j]. Разложение и подстановки стоят O(n·k²) и O(n·k).
+    """
+    #полуширина ленты: наибольшее |i - j| среди ненулевых элементов
+    @staticmethod
+    def bandwidth(A):
+        rows, cols = np.nonzero(np.asarray(A, dtype=float))
+        return int(np.abs(rows - cols).max()) if rows.size else 0
+    
+    #плотная матрица -> диагонали ленты
+    @staticmethod
+    def to_bands(A, k):
+        A = np.asarray(A, dtype=float)
+        n = len(A)
+        bands = np.zeros((2 * k + 1, n))
+        for d in range(-k, k + 1):
+            if d >= 0:
+                bands[k - d, d:] = A.diagonal(d)
+            else:
+                bands[k - d, :n + d] = A.diagonal(d)
+        return bands
+    
+    #диагонали ленты -> плотная матрица (для вывода)
+    @staticmethod
+    def from_bands(bands):
+        k = (len(bands) - 1) // 2
+        n = bands.shape[1]
+        A = np.zeros((n, n))
+        for d in range(-k, k + 1):
+            if d >= 0:
+                A[np.arange(n - d), np.arange(d, n)] = bands[k - d, d:]
+            else:
+                A[np.arange(-d, n), np.arange(n + d)] = bands[k - d, :n + d]
+        return A
+    
+    #упакованное разложение: множители L под главной диагональю ленты, U на ней и выше
+    @staticmethod
+    def factor(bands, progress=None, overwrite=False):
+        LU = np.asarray(bands, dtype=float) if overwrite else np.array(bands, dtype=float)
+        k = (len(LU) - 1) // 2
+        n = LU.shape[1]
+        if k <= BAND_SCALAR_WIDTH:
+            return BandedLUSolver._factor_narrow(LU, progress)
+        
+        offsets = np.arange(1, k + 1)
+        # строки ленты, где лежат элементы A[j + r][j + c] для r, c = 1..k
+        rows = k + offsets[:, None] - offsets[None, :]
+        
+        for j in range(n):
+            pivot = LU[k, j]
+            if abs(pivot) < PIVOT_TOLERANCE:
+                raise ValueError("Деление на ноль")
+            
+            m = min(k, n - 1 - j)
+            if m:
+                column = LU[k + 1:k + 1 + m, j]
+                column /= pivot
+                row = LU[k - offsets[:m], j + offsets[:m]]
+                LU[rows[:m, :m], j + offsets[:m]] -= np.outer(column, row)
+            
+            if progress and (j % BAND_PROGRESS_STEP == 0 or j == n - 1):
+                progress(j + 1, n)
+        
+        return LU
+    
+    @staticmethod
+    def _factor_narrow(LU, progress=None):
+        k = (len(LU) - 1) // 2
+        n = LU.shape[1]
+        columns = LU.T.tolist()
+        
+        for j in range(n):
+            column = columns[j]
+            pivot = column[k]
+            if abs(pivot) < PIVOT_TOLERANCE:
+                raise ValueError("Деление на ноль")
+            
+            m = min(k, n - 1 - j)
+            for r in range(k + 1, k + 1 + m):
+                column[r] /= pivot
+            for c in range(1, m + 1):
+                target = columns[j + c]
+                u = target[k - c]
+                if u:
+                    for r in range(1, m + 1):
+                        target[k + r - c] -= column[k + r] * u
+            
+            if progress and (j % BAND_PROGRESS_STEP == 0 or j == n - 1):
+                progress(j + 1, n)
+        
+        LU[:] = np.array(columns).T
+        return LU
+    
+    #прямая подстановка с единичной нижней лентой
+    @staticmethod
+    def forward_substitution(LU, b):
+        k = (len(LU) - 1) // 2
+        n = LU.shape[1]
+        y = np.array(b, dtype=float)
+        
+        if y.ndim == 1 and k <= BAND_SCALAR_WIDTH:
+            # lower[r][j] = L[j + r + 1][j]
+            lower = LU[k + 1:].tolist()
+            values = y.tolist()
+            for j in range(n - 1):
+                v = values[j]
+                if v:
+                    for r in range(min(k, n - 1 - j)):
+                        values[j + r + 1] -= lower[r][j] * v
+            return np.array(values)
+        
+        for j in range(n - 1):
+            m = min(k, n - 1 - j)
+            y[j + 1:j + 1 + m] -= np.multiply.outer(LU[k + 1:k + 1 + m, j], y[j])
+        
+        return y
+    
+    #обратная подстановка с верхней лентой
+    @staticmethod
+    def backward_substitution(LU, y):
+        k = (len(LU) - 1) // 2
+        n = LU.shape[1]
+        x = np.array(y, dtype=float)
+        
+        if x.ndim == 1 and k <= BAND_SCALAR_WIDTH:
+            # upper[r][j] = U[j - r][j]
+            upper = LU[k::-1].tolist()
+            values = x.tolist()
+            for j in range(n - 1, -1, -1):
+                v = values[j] / upper[0][j]
+                values[j] = v
+                if v:
+                    for r in range(1, min(k, j) + 1):
+                        values[j - r] -= upper[r][j] * v
+            return np.array(values)
+        
+        for j in range(n - 1, -1, -1):
+            x[j] /= LU[k, j]
+            m = min(k, j)
+            x[j - m:j] -= np.multiply.outer(LU[k - m:k, j], x[j])
+        
+        return x
+    
+    #разложение с выбором ведущего элемента в пределах ленты (как gbtrf в LAPACK).
+    #Перестановки строк расширяют U до 2k наддиагоналей, поэтому лента хранится в массиве
+    #(3k+1)×n: LU[2k + i - j, j] = A[i][j]. pivots[j] — строка, переставленная с j-й на шаге j
+    @staticmethod
+    def factor_pivoted(bands, progress=None):
+        k = (len(bands) - 1) // 2
+        n = bands.shape[1]
+        LU = np.zeros((3 * k + 1, n))
+        LU[k:] = bands
+        pivots = np.arange(n)
+        
+        offsets = np.arange(2 * k + 1)
+        # строки ленты, где лежат элементы A[j + r][j + c] для r = 1..k, c = 1..2k
+        rows = 2 * k + offsets[1:k + 1, None] - offsets[None, 1:]
+        
+        for j in range(n):
+            m = min(k, n - 1 - j)
+            width = min(2 * k, n - 1 - j)
+            p = int(np.argmax(np.abs(LU[2 * k:2 * k + m + 1, j])))
+            if abs(LU[2 * k + p, j]) < PIVOT_TOLERANCE:
+                raise ValueError("Матрица вырождена")
+            
+            if p:
+                # перестановка строк j и j + p в столбцах j..j + width
+                columns = j + offsets[:width + 1]
+                upper = 2 * k - offsets[:width + 1]
+                LU[upper, columns], LU[upper + p, columns] = LU[upper + p, columns], LU[upper, columns]
+                pivots[j] = j + p
+            
+            if m:
+                column = LU[2 * k + 1:2 * k + 1 + m, j]
+                column /= LU[2 * k, j]
+                row = LU[2 * k - offsets[1:width + 1], j + offsets[1:width + 1]]
+                LU[rows[:m, :width], j + offsets[1:width + 1]] -= np.outer(column, row)
+            
+            if progress and (j % BAND_PROGRESS_STEP == 0 or j == n - 1):
+                progress(j + 1, n)
+        
+        return LU, pivots
+    
+    #решение по разложению factor_pivoted: перестановки и L, затем U с 2k наддиагоналями
+    @staticmethod
+    def substitute_pivoted(LU, pivots, b):
+        k = (len(LU) - 1) // 3
+        n = LU.shape[1]
+        x = np.array(b, dtype=float)
+        
+        for j in range(n - 1):
+            p = pivots[j]
+            if p != j:
+                x[[j, p]] = x[[p, j]]
+            m = min(k, n - 1 - j)
+            x[j + 1:j + 1 + m] -= np.multiply.outer(LU[2 * k + 1:2 * k + 1 + m, j], x[j])
+        
+        for j in range(n - 1, -1, -1):
+            x[j] /= LU[2 * k, j]
+            m = min(2 * k, j)
+            x[j - m:j] -= np.multiply.outer(LU[2 * k - m:2 * k, j], x[j])
+        
+        return x
+    
+    #L и U из упакованной ленты (для вывода)
+    @staticmethod
+    def unpack(LU):
+        k = (len(LU) - 1) // 2
+        lower = np.zeros_like(LU)
+        lower[k] = 1.0
+        lower[k + 1:] = LU[k + 1:]
+        upper = np.zeros_like(LU)
+        upper[:k + 1] = LU[:k + 1]
+        return BandedLUSolver.from_bands(lower), BandedLUSolver.from_bands(upper)
+    
+    #диагональное преобладание по строкам или по столбцам (нестрогое) по ленте матрицы
+    @staticmethod
+    def diagonally_dominant(bands):
+        k = (len(bands) - 1) // 2
+        n = bands.shape[1]
+        magnitude = np.abs(bands)
+        diagonal = 2 * magnitude[k]
+        if np.all(diagonal >= magnitude.sum(axis=0)):
+            return True
+        # элемент bands[r, j] лежит в строке j + r - k
+        row_sums = np.zeros(n)
+        for r in range(len(bands)):
+            shift = r - k
+            row_sums[max(shift, 0):n + min(shift, 0)] += magnitude[r, max(-shift, 0):n - max(shift, 0)]
+        return bool(np.all(diagonal >= row_sums))
+    
+    #рост элементов при разложении: max(|L|, |U|) / max|A| по упакованной ленте
+    @staticmethod
+    def growth(bands, LU):
+        return max(1.0, float(np.abs(LU).max())) / float(np.abs(bands).max())
+    
+    #разложение без перестановок годится, если у матрицы диагональное преобладание
+    #или элементы L и U выросли не больше чем в BAND_GROWTH_LIMIT раз
+    @staticmethod
+    def stable(bands, LU):
+        return BandedLUSolver.diagonally_dominant(bands) or BandedLUSolver.growth(bands, LU) <= BAND_GROWTH_LIMIT
+    
+    #решение системы, заданной лентой; b — вектор или матрица правых частей.
+    #Возвращает решение и упакованное разложение
+    @staticmethod
+    def solve_bands(bands, b, progress=None):
+        LU = BandedLUSolver.factor(bands, progress)
+        return BandedLUSolver.backward_substitution(LU, BandedLUSolver.forward_substitution(LU, b)), LU
+    
+    #решение системы с плотной матрицей A, как у LUSolver: x, упакованная лента LU, перестановка
+    @staticmethod
+    def solve(A, b, progress=None):
+        x, LU = BandedLUSolver.solve_bands(BandedLUSolver.to_bands(A, BandedLUSolver.bandwidth(A)), b, progress)
+        return x, LU, np.arange(len(x))
+    
+    calculate_residual = staticmethod(LUSolver.calculate_residual)
+    residual_norm = staticmethod(LUSolver.residual_norm)
+
+
+class TridiagonalSolver:
+    """Метод прогонки (алгоритм Томаса) для трехдиагональной матрицы за O(n).
+
+    Диагонали хранятся в массиве 3×n так же, как у BandedLUSolver при k = 1:
+    bands[0] — наддиагональ, bands[1] — главная диагональ, bands[2] — поддиагональ.
+    """
+    #прогонка; возвращает решение и ведущие элементы (диагональ U)
+    @staticmethod
+    def sweep(bands, b, progress=None):
+        n = len(bands[1])
+        # Скалярный цикл быстрее на обычных числах, чем на элементах массива
+        upper = bands[0].tolist()
+        diagonal = bands[1].tolist()
+        lower = bands[2].tolist()
+        d = np.asarray(b, dtype=float).tolist()
+        
+        pivots = [0.0] * n
+        c = [0.0] * n
+        y = [0.0] * n
+        
+        # прямой ход: c[i] = A[i][i+1] / m[i], y[i] — преобразованная правая часть
+        for i in range(n):
+            a = lower[i - 1] if i else 0.0
+            m = diagonal[i] - (a * c[i - 1] if i else 0.0)
+            if abs(m) < PIVOT_TOLERANCE:
+                raise ValueError("Деление на ноль")
+            pivots[i] = m
+            if i < n - 1:
+                c[i] = upper[i + 1] / m
+            y[i] = (d[i] - (a * y[i - 1] if i else 0.0)) / m
+            
+            if progress and (i % BAND_PROGRESS_STEP == 0 or i == n - 1):
+                progress(i + 1, n)
+        
+        # обратный ход
+        x = y
+        for i in range(n - 2, -1, -1):
+            x[i] -= c[i] * x[i + 1]
+        
+        return np.array(x), np.array(pivots)
+    
+    #решение системы, заданной лентой 3×n; возвращает решение и разложение, упакованное
+    #как у BandedLUSolver
+    @staticmethod
+    def solve_bands(bands, b, progress=None):
+        x, pivots = TridiagonalSolver.sweep(bands, b, progress)
+        
+        # прогонка — это LU-разложение: l[i] = A[i][i-1] / m[i-1], U — m[i] и наддиагональ A
+        packed = np.array(bands, dtype=float)
+        packed[1] = pivots
+        packed[2, :-1] /= pivots[:-1]
+        return x, packed
+    
+    #решение системы с плотной матрицей A, как у LUSolver
+    @staticmethod
+    def solve(A, b, progress=None):
+        x, packed = TridiagonalSolver.solve_bands(BandedLUSolver.to_bands(A, 1), b, progress)
+        return x, packed, np.arange(len(x))
+    
+    calculate_residual = staticmethod(LUSolver.calculate_residual)
+    residual_norm = staticmethod(LUSolver.residual_norm)
+
+
+def solve_by_structure(A, b, progress=None):
+    """Решает Ax = b методом под структуру A: прогонкой для трехдиагональной матрицы,
+    ленточным LU для узкой ленты, иначе плотным LU с выбором ведущего элемента.
+    В результате 'LU' — упакованное разложение, 'unpack' собирает из него L и U для
+    вывода. CSRMatrix решается разреженным LU (SparseLUSolver) с той же проверкой
+    устойчивости, разложение для нее не хранится (None).
+
+    Ленточные методы работают без перестановок строк, поэтому устойчивы только
+    для матриц с диагональным преобладанием. Для остальных ленточный результат
+    принимается, если элементы L и U выросли не больше чем в BAND_GROWTH_LIMIT раз;
+    иначе, как и при нулевом ведущем элементе, система решается плотным LU.
+    """
+    if isinstance(A, CSRMatrix):
+        x, perm, k, pivoted = SparseLUSolver.solve(A, b, progress)
+        method = "разреженное LU-разложение с перенумерацией Катхилла–Макки"
+        if pivoted:
+            method += " и выбором ведущего элемента"
+        return {'x': x, 'LU': None, 'unpack': None, 'perm': perm, 'bandwidth': k, 'method': method}
+    
+    A = np.asarray(A, dtype=float)
+    k = BandedLUSolver.bandwidth(A)
+    
+    if 2 * k + 1 < len(A):
+        solver, method = ((TridiagonalSolver, "метод прогонки") if k <= 1
+                          else (BandedLUSolver, "ленточное LU-разложение"))
+        # L, U и проверка устойчивости работают с лентой (2k+1)×n, плотные L и U не собираются
+        bands = BandedLUSolver.to_bands(A, max(k, 1))
+        try:
+            x, LU = solver.solve_bands(bands, b, progress)
+            if BandedLUSolver.stable(bands, LU):
+                return {'x': x, 'LU': LU, 'unpack': BandedLUSolver.unpack, 'perm': np.arange(len(A)),
+                        'bandwidth': k, 'method': method}
+        except ValueError:
+            pass
+    
+    x, LU, perm = LUSolver.solve(A, b, progress)
+    return {'x': x, 'LU': LU, 'unpack': LUSolver.unpack, 'perm': perm, 'bandwidth': k,
+            'method': "LU-разложение с выбором ведущего элемента"}
+
+
+class CSRMatrix:
+    """Разреженная матрица в формате CSR: ненулевые элементы строки i лежат в
+    data[indptr[i]:indptr[i+1]], их столбцы — в indices[indptr[i]:indptr[i+1]]"""
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = tuple(shape)
+
+    @classmethod
+    def from_coo(cls, rows, cols, values, shape):
+        """Собирает матрицу из троек (строка, столбец, значение); повторы складываются"""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        keys, inverse = np.unique(rows * shape[1] + cols, return_inverse=True)
+        data = np.bincount(inverse, weights=np.asarray(values, dtype=float), minlength=len(keys))
+        row_of_key = keys // shape[1]
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_of_key, minlength=shape[0]), out=indptr[1:])
+        return cls(data, keys % shape[1], indptr, shape)
+
+    @classmethod
+    def from_dense(cls, A):
+        A = np.asarray(A, dtype=float)
+        rows, cols = np.nonzero(A)
+        return cls.from_coo(rows, cols, A[rows, cols], A.shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def row_ids(self):
+        """Номер строки для каждого хранимого элемента"""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def diagonal(self):
+        rows = self.row_ids()
+        on_diagonal = rows == self.indices
+        diagonal = np.zeros(min(self.shape))
+        diagonal[rows[on_diagonal]] = self.data[on_diagonal]
+        return diagonal
+
+    def __matmul__(self, x):
+        x = np.asarray(x, dtype=float)
+        return np.bincount(self.row_ids(), weights=self.data * x[self.indices], minlength=self.shape[0])
+
+    def to_dense(self):
+        A = np.zeros(self.shape)
+        A[self.row_ids(), self.indices] = self.data
+        return A
+
+
+def load_matrix_market(path):
+    """Читает файл Matrix Market: coordinate (real, integer, pattern; general или
+    symmetric) — в CSRMatrix, array — в плотный массив numpy"""
+    with open(path, encoding='utf-8') as file:
+        header = file.readline().split()
+        if len(header) < 5 or header[0].lower() != '%%matrixmarket' or header[1].lower() != 'matrix':
+            raise ValueError("Файл не в формате Matrix Market")
+        layout, field, symmetry = (word.lower() for word in header[2:5])
+        if field not in ('real', 'integer', 'pattern') or symmetry not in ('general', 'symmetric'):
+            raise ValueError(f"Неподдерживаемый вид матрицы: {field} {symmetry}")
+        
+        line = file.readline()
+        while line.startswith('%') or not line.strip():
+            line = file.readline()
+        size = [int(value) for value in line.split()]
+        # Все числа файла читаются одним разбором строки, без цикла по записям
+        values = np.array(file.read().split(), dtype=float)
+    
+    if layout == 'array':
+        rows, cols = size[:2]
+        if symmetry != 'general':
+            raise ValueError("Симметричный формат array не поддерживается")
+        # array хранит матрицу по столбцам
+        return values.reshape(cols, rows).T.copy() if cols > 1 else values
+    
+    rows, cols, count = size
+    width = 2 if field == 'pattern' else 3
+    entries = values.reshape(count, width)
+    i = entries[:, 0].astype(np.int64) - 1
+    j = entries[:, 1].astype(np.int64) - 1
+    v = np.ones(count) if field == 'pattern' else entries[:, 2]
+    if symmetry == 'symmetric':
+        # хранится только нижний треугольник: достраиваем верхний без повтора диагонали
+        off = i != j
+        i, j, v = np.concatenate([i, j[off]]), np.concatenate([j, i[off]]), np.concatenate([v, v[off]])
+    return CSRMatrix.from_coo(i, j, v, (rows, cols))
+
+
+class SparseLUSolver:
+    """LU-разложение разреженной матрицы через перенумерацию неизвестных.
+
+    Обратный алгоритм Катхилла–Макки переставляет строки и столбцы так, что
+    ненулевые элементы собираются у диагонали. Он уменьшает ширину ленты, а не
+    заполнение: внутри ленты разложение заполняется целиком, зато за ее пределы
+    заполнение не выходит, и переставленная матрица решается ленточным LU.
+
+    Сначала пробуется разложение без перестановок строк; если ведущий элемент
+    нулевой или разложение неустойчиво (BandedLUSolver.stable), система решается
+    с выбором ведущего элемента в пределах ленты.
+    """
+    #перестановка обратного алгоритма Катхилла–Макки, уменьшающая ширину ленты
+    @staticmethod
+    def reverse_cuthill_mckee(A):
+        n = len(A)
+        rows, cols = A.row_ids(), A.indices
+        # структура A + Aᵀ без диагонали
+        off = rows != cols
+        rows, cols = np.concatenate([rows[off], cols[off]]), np.concatenate([cols[off], rows[off]])
+        keys = np.unique(rows * n + cols)
+        rows, cols = keys // n, keys % n
+        degree = np.bincount(rows, minlength=n)
+        # соседи каждой вершины заранее упорядочены по возрастанию степени
+        order = np.lexsort((degree[cols], rows))
+        neighbours = cols[order].tolist()
+        starts = np.concatenate([[0], np.cumsum(degree)]).tolist()
+        
+        visited = [False] * n
+        result = []
+        # обход в ширину от вершины наименьшей степени в каждой связной компоненте
+        for start in np.argsort(degree, kind='stable').tolist():
+            if visited[start]:
+                continue
+            visited[start] = True
+            queue = deque([start])
+            while queue:
+                v = queue.popleft()
+                result.append(v)
+                for u in neighbours[starts[v]:starts[v + 1]]:
+                    if not visited[u]:
+                        visited[u] = True
+                        queue.append(u)
+        
+        return np.array(result[::-1], dtype=np.int64)
+    
+    #лента переставленной матрицы PAPᵀ, где строка i — это A[perm[i]]
+    @staticmethod
+    def to_bands(A, perm):
+        n = len(A)
+        position = np.empty(n, dtype=np.int64)
+        position[perm] = np.arange(n)
+        rows, cols = position[A.row_ids()], position[A.indices]
+        k = int(np.abs(rows - cols).max()) if A.nnz else 0
+        if (2 * k + 1) * n > SPARSE_BAND_LIMIT:
+            raise ValueError(f"Лента после перенумерации слишком широкая: k = {k}")
+        bands = np.zeros((2 * k + 1, n))
+        bands[k + rows - cols, cols] = A.data
+        return bands
+    
+    #решение системы; возвращает x, перестановку, полуширину ленты и признак того,
+    #что понадобился выбор ведущего элемента
+    @staticmethod
+    def solve(A, b, progress=None):
+        perm = SparseLUSolver.reverse_cuthill_mckee(A)
+        bands = SparseLUSolver.to_bands(A, perm)
+        k = (len(bands) - 1) // 2
+        b = np.asarray(b, dtype=float)[perm]
+        x = np.empty(len(A))
+        
+        try:
+            x[perm], LU = BandedLUSolver.solve_bands(bands, b, progress)
+            if BandedLUSolver.stable(bands, LU):
+                return x, perm, k, False
+        except ValueError:
+            pass
+        
+        if (3 * k + 1) * len(A) > SPARSE_BAND_LIMIT:
+            raise ValueError(f"Лента с выбором ведущего элемента слишком широкая: k = {k}")
+        LU, pivots = BandedLUSolver.factor_pivoted(bands, progress)
+        x[perm] = BandedLUSolver.substitute_pivoted(LU, pivots, b)
+        return x, perm, k, True
+    
+    calculate_residual = staticmethod(LUSolver.calculate_residual)
+    residual_norm = staticmethod(LUSolver.residual_norm)
+
+
+class SeidelSolver:
+    """Метод Зейделя с верхней релаксацией (SOR): x[i] += ω·(b[i] - A[i]·x) / A[i][i].
+
+    При ω = 1 это обычный метод Зейделя. С auto_omega проходы идут с ω = 1, пока
+    отношение соседних поправок не установится; по нему оценивается спектральный
+    радиус ρ итерации Зейделя, дальше используется ω = 2 / (1 + √(1 - ρ)) —
+    оптимум для согласованно упорядоченных матриц, но не больше OMEGA_MAX.
+    Если с новым ω поправки перестают убывать, метод возвращается к ω = 1.
+    """
+    @staticmethod
+    def check_convergence(A):
+        if isinstance(A, CSRMatrix):
+            diagonal = np.abs(A.diagonal())
+            row_sums = np.bincount(A.row_ids(), weights=np.abs(A.data), minlength=len(A))
+        else:
+            A = np.abs(np.asarray(A, dtype=float))
+            diagonal = np.diag(A)
+            row_sums = A.sum(axis=1)
+        return bool(np.all(diagonal > row_sums - diagonal))
+    
+    #оценка ω по поправкам проходов с ω = 1; None, пока скорость не установилась
+    @staticmethod
+    def estimate_omega(diffs):
+        if len(diffs) < max(OMEGA_PROBE_SWEEPS, OMEGA_RATE_WINDOW + 1):
+            return None
+        recent = diffs[-OMEGA_RATE_WINDOW - 1:]
+        if min(recent) <= 0:
+            return 1.0
+        ratios = [d1 / d0 for d0, d1 in zip(recent, recent[1:])]
+        if max(ratios) - min(ratios) > OMEGA_RATE_TOLERANCE:
+            return None
+        # среднее геометрическое последних отношений сглаживает колебания
+        rho = float(np.prod(ratios)) ** (1 / len(ratios))
+        if not 0 < rho < 1:
+            return 1.0
+        return min(2 / (1 + (1 - rho) ** 0.5), OMEGA_MAX)
+    
+    @staticmethod
+    def solve(A, b, epsilon=1e-4, max_iterations=1000, progress=None, omega=1.0, auto_omega=False):
+        if isinstance(A, CSRMatrix):
+            x, sweep = SeidelSolver._sparse_sweep(A, b)
+        else:
+            x, sweep = SeidelSolver._dense_sweep(A, b)
+        
+        current = 1.0 if auto_omega else omega
+        probing = auto_omega
+        # поправка на последней проверке после переключения ω и проходов с тех пор
+        checkpoint, since_check = None, 0
+        iterations = 0
+        history = []
+        
+        for iteration in range(max_iterations):
+            iterations += 1
+            max_diff = sweep(x, current)
+            
+            record = {
+                'iteration': iteration + 1,
+                'max_diff': max_diff,
+                'omega': current
+            }
+            # Для разреженных систем вектор x в историю не пишется: это n чисел на итерацию
+            if not isinstance(A, CSRMatrix):
+                record['x'] = x.copy()
+            history.append(record)
+            
+            if progress:
+                progress(iteration + 1, max_iterations)
+            
+            if max_diff < epsilon:
+                break
+            
+            if probing:
+                estimate = SeidelSolver.estimate_omega([item['max_diff'] for item in history])
+                if estimate is not None:
+                    probing = False
+                    current = estimate
+                    checkpoint, since_check = max_diff, 0
+            elif auto_omega and current != 1.0:
+                since_check += 1
+                if since_check == OMEGA_CHECK_SWEEPS:
+                    if max_diff >= checkpoint:
+                        # с подобранным ω поправки не убывают — обычный метод Зейделя надежнее
+                        current = 1.0
+                    checkpoint, since_check = max_diff, 0
+        
+        return np.asarray(x, dtype=float), iterations, history
+    
+    #проход по плотной матрице: обновление строки — скалярное произведение строки на текущий x
+    @staticmethod
+    def _dense_sweep(A, b):
+        A = np.asarray(A, dtype=float)
+        b = np.asarray(b, dtype=float)
+        diagonal = np.diag(A).copy()
+        if np.any(np.abs(diagonal) < 1e-10):
+            raise ValueError("Деление на ноль")
+        
+        def sweep(x, omega):
+            max_diff = 0.0
+            for i in range(len(x)):
+                delta = omega * (b[i] - A[i] @ x) / diagonal[i]
+                x[i] += delta
+                max_diff = max(max_diff, abs(delta))
+            return max_diff
+        
+        return np.zeros(len(b)), sweep
+    
+    #проход по CSRMatrix касается только хранимых элементов, O(nnz)
+    @staticmethod
+    def _sparse_sweep(A, b):
+        n = len(A)
+        diagonal = A.diagonal()
+        if np.any(np.abs(diagonal) < 1e-10):
+            raise ValueError("Деление на ноль")
+        
+        # Внедиагональные элементы — плоскими списками: скалярный цикл по ним
+        # быстрее поэлементного обращения к массивам numpy
+        rows = A.row_ids()
+        off = rows != A.indices
+        data = A.data[off].tolist()
+        indices = A.indices[off].tolist()
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows[off], minlength=n))]).tolist()
+        diagonal = diagonal.tolist()
+        b = np.asarray(b, dtype=float).tolist()
+        
+        def sweep(x, omega):
+            max_diff = 0.0
+            for i in range(n):
+                sum_val = 0.0
+                for p in range(indptr[i], indptr[i + 1]):
+                    sum_val += data[p] * x[indices[p]]
+                
+                delta = omega * ((b[i] - sum_val) / diagonal[i] - x[i])
+                x[i] += delta
+                if abs(delta) > max_diff:
+                    max_diff = abs(delta)
+            return max_diff
+        
+        return [0.0] * n, sweep
+    
+    calculate_residual = staticmethod(LUSolver.calculate_residual)
+    residual_norm = staticmethod(LUSolver.residual_norm)
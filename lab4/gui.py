@@ -0,0 +1,525 @@
+import os
+import sys
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+import numpy as np
+
+from core import (
+    SolverCancelled, LUSolver, SeidelSolver, LU_CACHE, solve_by_structure, CSRMatrix, load_matrix_market
+)
+
+# common/ лежит рядом с каталогами лабораторных
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from common.taskpanel import TaskPanel, close_on_delete
+
+
+# Сколько компонент вектора выводить: у больших систем — начало и конец
+DISPLAY_COMPONENTS = 20
+
+
+def vector_lines(name, values, spec):
+    n = len(values)
+    if n <= DISPLAY_COMPONENTS:
+        shown = list(range(n))
+    else:
+        half = DISPLAY_COMPONENTS // 2
+        shown = [*range(half), None, *range(n - half, n)]
+    return [f"  ... (еще {n - DISPLAY_COMPONENTS})\n" if i is None else f"  {name}[{i}] = {values[i]:{spec}}\n"
+            for i in shown]
+
+
+def ask_matrix_market():
+    """Спрашивает файл матрицы A в формате Matrix Market. Правая часть читается
+    из файла <имя>_b.mtx рядом с ним, а если его нет, b — вектор из единиц.
+    Возвращает (путь, A, b) или None, если файл не выбран"""
+    path = filedialog.askopenfilename(
+        title="Выберите матрицу Matrix Market",
+        filetypes=[("Matrix Market", "*.mtx"), ("All Files", "*.*")],
+    )
+    if not path:
+        return None
+    
+    A = load_matrix_market(path)
+    if not isinstance(A, CSRMatrix):
+        A = CSRMatrix.from_dense(np.atleast_2d(A))
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("Матрица должна быть квадратной")
+    
+    b_path = os.path.splitext(path)[0] + "_b.mtx"
+    if os.path.exists(b_path):
+        b = load_matrix_market(b_path)
+        b = b.to_dense() if isinstance(b, CSRMatrix) else b
+        b = np.ravel(b)
+        if len(b) != len(A):
+            raise ValueError("Размер b не совпадает с размером A")
+    else:
+        b = np.ones(len(A))
+    return path, A, b
+
+
+class LUTab(ttk.Frame):    
+    def __init__(self, parent, default_A, default_b):
+        super().__init__(parent)
+        self.default_A = default_A
+        self.default_b = default_b
+        self.n = len(default_A)
+        self.sparse_system = None
+        self.create_widgets()
+    
+    def create_widgets(self):
+        dim_frame = ttk.LabelFrame(self, text="Размерность системы", padding=10)
+        dim_frame.pack(fill="x", padx=10, pady=5)
+        
+        ttk.Label(dim_frame, text="n =").pack(side="left")
+        self.n_var = tk.IntVar(value=self.n)
+        ttk.Spinbox(dim_frame, from_=2, to=10, textvariable=self.n_var, width=5).pack(side="left", padx=5)
+        ttk.Button(dim_frame, text="Изменить размер", command=self.change_dimension).pack(side="left", padx=5)
+        ttk.Button(dim_frame, text="Загрузить .mtx", command=self.load_matrix_file).pack(side="left", padx=5)
+        self.file_label = ttk.Label(dim_frame, text="")
+        self.file_label.pack(side="left", padx=5)
+        
+        matrix_frame = ttk.LabelFrame(self, text="Матрица коэффициентов A", padding=10)
+        matrix_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        self.matrix_entries_frame = ttk.Frame(matrix_frame)
+        self.matrix_entries_frame.pack()
+        
+        vector_frame = ttk.LabelFrame(self, text="Вектор правой части b", padding=10)
+        vector_frame.pack(fill="x", padx=10, pady=5)
+        
+        self.vector_entries_frame = ttk.Frame(vector_frame)
+        self.vector_entries_frame.pack()
+        
+        ttk.Button(self, text="Решить СЛАУ", command=self.solve_system).pack(pady=10)
+        self.task_panel = TaskPanel(self, SolverCancelled)
+        self.task_panel.pack()
+        
+        result_frame = ttk.LabelFrame(self, text="Результаты", padding=10)
+        result_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        self.result_text = tk.Text(result_frame, height=15, width=100)
+        scrollbar = ttk.Scrollbar(result_frame, command=self.result_text.yview)
+        self.result_text.configure(yscrollcommand=scrollbar.set)
+        self.result_text.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        self.create_input_fields()
+    
+    def load_matrix_file(self):
+        try:
+            loaded = ask_matrix_market()
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось прочитать матрицу:\n{str(e)}")
+            return
+        if loaded is None:
+            return
+        
+        # Загруженная система решается вместо введенной, пока не изменен размер
+        path, A, b = loaded
+        self.sparse_system = (A, b)
+        self.file_label.config(text=f"{os.path.basename(path)}: n = {len(A)}, ненулевых {A.nnz}")
+    
+    def change_dimension(self):
+        self.sparse_system = None
+        self.file_label.config(text="")
+        self.n = self.n_var.get()
+        
+        if self.n > len(self.default_A):
+            for row in self.default_A:
+                while len(row) < self.n:
+                    row.append(0)
+            while len(self.default_A) < self.n:
+                self.default_A.append([0] * self.n)
+            while len(self.default_b) < self.n:
+                self.default_b.append(0)
+        
+        self.create_input_fields()
+    
+    def create_input_fields(self):
+        for widget in self.matrix_entries_frame.winfo_children():
+            widget.destroy()
+        for widget in self.vector_entries_frame.winfo_children():
+            widget.destroy()
+        
+        self.matrix_entries = []
+        self.vector_entries = []
+        
+        for i in range(self.n):
+            row_entries = []
+            for j in range(self.n):
+                entry = ttk.Entry(self.matrix_entries_frame, width=10)
+                entry.grid(row=i, column=j, padx=2, pady=2)
+                default_val = self.default_A[i][j] if i < len(self.default_A) and j < len(self.default_A[i]) else 0
+                entry.insert(0, str(default_val))
+                row_entries.append(entry)
+            self.matrix_entries.append(row_entries)
+        
+        for i in range(self.n):
+            entry = ttk.Entry(self.vector_entries_frame, width=10)
+            entry.grid(row=i, column=0, padx=2, pady=2)
+            default_val = self.default_b[i] if i < len(self.default_b) else 0
+            entry.insert(0, str(default_val))
+            self.vector_entries.append(entry)
+    
+    def get_matrix_and_vector(self):
+        try:
+            A = []
+            for i in range(self.n):
+                row = []
+                for j in range(self.n):
+                    val = float(self.matrix_entries[i][j].get())
+                    row.append(val)
+                A.append(row)
+            
+            b = []
+            for i in range(self.n):
+                val = float(self.vector_entries[i].get())
+                b.append(val)
+            
+            return A, b
+        except ValueError:
+            messagebox.showerror("Ошибка", "Введите корректные числовые значения!")
+            return None, None
+    
+    def solve_system(self):
+        if self.sparse_system is not None:
+            A, b = self.sparse_system
+        else:
+            A, b = self.get_matrix_and_vector()
+        
+        if A is None or b is None:
+            return
+        
+        # Разложение считается в фоновом потоке; метод выбирается по ширине ленты A
+        def work(progress):
+            solution = solve_by_structure(A, b, progress)
+            residual = LUSolver.calculate_residual(A, solution['x'], b)
+            return solution, residual, LUSolver.residual_norm(residual)
+        
+        def on_error(e):
+            messagebox.showerror("Ошибка", f"Ошибка при решении СЛАУ:\n{str(e)}")
+        
+        self.task_panel.run(work, self.display_solution, on_error)
+    
+    def display_solution(self, result):
+        solution, residual, residual_norm = result
+        try:
+            x, perm = solution['x'], solution['perm']
+            
+            # Текст собирается целиком и вставляется одним вызовом
+            lines = []
+            
+            lines.append("=" * 80 + "\n")
+            lines.append("РЕШЕНИЕ СЛАУ МЕТОДОМ LU-РАЗЛОЖЕНИЯ\n")
+            lines.append("=" * 80 + "\n\n")
+            
+            lines.append(f"Полуширина ленты матрицы: {solution['bandwidth']}, "
+                         f"метод: {solution['method']}\n")
+            
+            # У разреженной системы разложение не хранится, а у большой матрицы L и U
+            # не выводятся: плотные копии собираются только для показа
+            if solution['LU'] is not None and len(x) <= DISPLAY_COMPONENTS:
+                L, U = solution['unpack'](solution['LU'])
+                lines.append("Перестановка строк (PA = LU): "
+                             + " ".join(str(p) for p in perm) + "\n\n")
+                
+                lines.append("Нижнетреугольная матрица L:\n")
+                for row in L:
+                    lines.append("  " + "  ".join(f"{val:10.6f}" for val in row) + "\n")
+                
+                lines.append("\nВерхнетреугольная матрица U:\n")
+                for row in U:
+                    lines.append("  " + "  ".join(f"{val:10.6f}" for val in row) + "\n")
+            
+            lines.append("\n" + "=" * 80 + "\n")
+            lines.append("РЕШЕНИЕ (вектор x):\n")
+            lines.append("=" * 80 + "\n")
+            lines.extend(vector_lines("x", x, "12.8f"))
+            
+            lines.append("\n" + "=" * 80 + "\n")
+            lines.append("ПРОВЕРКА (невязка r = Ax - b):\n")
+            lines.append("=" * 80 + "\n")
+            lines.extend(vector_lines("r", residual, "12.8e"))
+            
+            lines.append(f"\nНорма невязки: {residual_norm:12.8e}\n")
+            
+            if residual_norm < 1e-8:
+                lines.append("\n✓ Решение найдено с высокой точностью!\n")
+            
+            stats = LU_CACHE.stats()
+            lines.append(f"\nКэш разложений: попаданий {stats['hits']}, промахов {stats['misses']}, "
+                         f"записей {stats['size']} из {stats['maxsize']}\n")
+            
+            self.result_text.delete(1.0, tk.END)
+            self.result_text.insert(tk.END, "".join(lines))
+            
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Ошибка при решении СЛАУ:\n{str(e)}")
+
+
+class SeidelTab(ttk.Frame):
+    def __init__(self, parent, default_A, default_b):
+        super().__init__(parent)
+        self.default_A = default_A
+        self.default_b = default_b
+        self.n = len(default_A)
+        self.sparse_system = None
+        self.create_widgets()
+    
+    def create_widgets(self):
+        dim_frame = ttk.LabelFrame(self, text="Размерность системы", padding=10)
+        dim_frame.pack(fill="x", padx=10, pady=5)
+        
+        ttk.Label(dim_frame, text="n =").pack(side="left")
+        self.n_var = tk.IntVar(value=self.n)
+        ttk.Spinbox(dim_frame, from_=2, to=10, textvariable=self.n_var, width=5).pack(side="left", padx=5)
+        ttk.Button(dim_frame, text="Изменить размер", command=self.change_dimension).pack(side="left", padx=5)
+        ttk.Button(dim_frame, text="Загрузить .mtx", command=self.load_matrix_file).pack(side="left", padx=5)
+        self.file_label = ttk.Label(dim_frame, text="")
+        self.file_label.pack(side="left", padx=5)
+        
+        params_frame = ttk.LabelFrame(self, text="Параметры метода", padding=10)
+        params_frame.pack(fill="x", padx=10, pady=5)
+        
+        ttk.Label(params_frame, text="Точность ε =").pack(side="left")
+        self.epsilon_var = tk.StringVar(value="1e-4")
+        ttk.Entry(params_frame, textvariable=self.epsilon_var, width=10).pack(side="left", padx=5)
+        
+        ttk.Label(params_frame, text="Макс. итераций =").pack(side="left", padx=(20, 0))
+        self.max_iter_var = tk.IntVar(value=1000)
+        ttk.Entry(params_frame, textvariable=self.max_iter_var, width=10).pack(side="left", padx=5)
+        
+        ttk.Label(params_frame, text="ω =").pack(side="left", padx=(20, 0))
+        self.omega_var = tk.StringVar(value="1.0")
+        ttk.Entry(params_frame, textvariable=self.omega_var, width=6).pack(side="left", padx=5)
+        self.auto_omega_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(params_frame, text="Подобрать ω", variable=self.auto_omega_var).pack(side="left", padx=5)
+        
+        matrix_frame = ttk.LabelFrame(self, text="Матрица коэффициентов A", padding=10)
+        matrix_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        self.matrix_entries_frame = ttk.Frame(matrix_frame)
+        self.matrix_entries_frame.pack()
+        
+        vector_frame = ttk.LabelFrame(self, text="Вектор правой части b", padding=10)
+        vector_frame.pack(fill="x", padx=10, pady=5)
+        
+        self.vector_entries_frame = ttk.Frame(vector_frame)
+        self.vector_entries_frame.pack()
+        
+        ttk.Button(self, text="Решить СЛАУ методом Зейделя", command=self.solve_system).pack(pady=10)
+        self.task_panel = TaskPanel(self, SolverCancelled)
+        self.task_panel.pack()
+        
+        result_frame = ttk.LabelFrame(self, text="Результаты", padding=10)
+        result_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        self.result_text = tk.Text(result_frame, height=15, width=100)
+        scrollbar = ttk.Scrollbar(result_frame, command=self.result_text.yview)
+        self.result_text.configure(yscrollcommand=scrollbar.set)
+        self.result_text.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        self.create_input_fields()
+    
+    def load_matrix_file(self):
+        try:
+            loaded = ask_matrix_market()
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось прочитать матрицу:\n{str(e)}")
+            return
+        if loaded is None:
+            return
+        
+        # Загруженная система решается вместо введенной, пока не изменен размер
+        path, A, b = loaded
+        self.sparse_system = (A, b)
+        self.file_label.config(text=f"{os.path.basename(path)}: n = {len(A)}, ненулевых {A.nnz}")
+    
+    def change_dimension(self):
+        self.sparse_system = None
+        self.file_label.config(text="")
+        self.n = self.n_var.get()
+        
+        if self.n > len(self.default_A):
+            for row in self.default_A:
+                while len(row) < self.n:
+                    row.append(0)
+            while len(self.default_A) < self.n:
+                self.default_A.append([0] * self.n)
+            while len(self.default_b) < self.n:
+                self.default_b.append(0)
+        
+        self.create_input_fields()
+    
+    def create_input_fields(self):
+        for widget in self.matrix_entries_frame.winfo_children():
+            widget.destroy()
+        for widget in self.vector_entries_frame.winfo_children():
+            widget.destroy()
+        
+        self.matrix_entries = []
+        self.vector_entries = []
+        
+        for i in range(self.n):
+            row_entries = []
+            for j in range(self.n):
+                entry = ttk.Entry(self.matrix_entries_frame, width=10)
+                entry.grid(row=i, column=j, padx=2, pady=2)
+                default_val = self.default_A[i][j] if i < len(self.default_A) and j < len(self.default_A[i]) else 0
+                entry.insert(0, str(default_val))
+                row_entries.append(entry)
+            self.matrix_entries.append(row_entries)
+        
+        for i in range(self.n):
+            entry = ttk.Entry(self.vector_entries_frame, width=10)
+            entry.grid(row=i, column=0, padx=2, pady=2)
+            default_val = self.default_b[i] if i < len(self.default_b) else 0
+            entry.insert(0, str(default_val))
+            self.vector_entries.append(entry)
+    
+    def get_matrix_and_vector(self):
+        try:
+            A = []
+            for i in range(self.n):
+                row = []
+                for j in range(self.n):
+                    val = float(self.matrix_entries[i][j].get())
+                    row.append(val)
+                A.append(row)
+            
+            b = []
+            for i in range(self.n):
+                val = float(self.vector_entries[i].get())
+                b.append(val)
+            
+            return A, b
+        except ValueError:
+            messagebox.showerror("Ошибка", "Введите корректные числовые значения!")
+            return None, None
+    
+    def solve_system(self):
+        if self.sparse_system is not None:
+            A, b = self.sparse_system
+        else:
+            A, b = self.get_matrix_and_vector()
+        
+        if A is None or b is None:
+            return
+        
+        try:
+            epsilon = float(self.epsilon_var.get())
+            max_iter = self.max_iter_var.get()
+        except ValueError:
+            messagebox.showerror("Ошибка", "Введите корректное значение точности!")
+            return
+        
+        auto_omega = self.auto_omega_var.get()
+        try:
+            omega = float(self.omega_var.get())
+            if not 0 < omega < 2:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Ошибка", "Параметр релаксации ω должен быть в интервале (0, 2)!")
+            return
+        
+        if not SeidelSolver.check_convergence(A):
+            messagebox.showwarning("Предупреждение", 
+                "Матрица не имеет диагонального преобладания.\n" +
+                "Метод Зейделя может не сойтись!")
+        
+        # Итерации считаются в фоновом потоке
+        def work(progress):
+            x, iterations, history = SeidelSolver.solve(A, b, epsilon, max_iter, progress, omega, auto_omega)
+            residual = SeidelSolver.calculate_residual(A, x, b)
+            return x, iterations, history, residual, SeidelSolver.residual_norm(residual)
+        
+        def on_error(e):
+            messagebox.showerror("Ошибка", f"Ошибка при решении СЛАУ:\n{str(e)}")
+        
+        self.task_panel.run(work, lambda result: self.display_solution(result, epsilon, max_iter), on_error)
+    
+    def display_solution(self, result, epsilon, max_iter):
+        x, iterations, history, residual, residual_norm = result
+        try:
+            # Текст собирается целиком и вставляется одним вызовом
+            lines = []
+            
+            lines.append("=" * 80 + "\n")
+            lines.append("РЕШЕНИЕ СЛАУ МЕТОДОМ ЗЕЙДЕЛЯ\n")
+            lines.append("=" * 80 + "\n\n")
+            
+            lines.append(f"Точность: ε = {epsilon}\n")
+            lines.append(f"Параметр релаксации: ω = {history[0]['omega']:.4f}\n")
+            # при подборе ω меняется по ходу решения: выводим, с какой итерации действовало каждое значение
+            for previous, item in zip(history, history[1:]):
+                if item['omega'] != previous['omega']:
+                    lines.append(f"  с итерации {item['iteration']}: ω = {item['omega']:.4f}\n")
+            lines.append(f"Количество итераций: {iterations}\n\n")
+            
+            lines.append("Последние итерации:\n")
+            lines.append("-" * 80 + "\n")
+            start_idx = max(0, len(history) - 10)
+            for item in history[start_idx:]:
+                lines.append(
+                    f"Итерация {item['iteration']:3d}: max_diff = {item['max_diff']:12.8e}\n")
+            
+            lines.append("\n" + "=" * 80 + "\n")
+            lines.append("РЕШЕНИЕ (вектор x):\n")
+            lines.append("=" * 80 + "\n")
+            lines.extend(vector_lines("x", x, "12.8f"))
+            
+            lines.append("\n" + "=" * 80 + "\n")
+            lines.append("ПРОВЕРКА (невязка r = Ax - b):\n")
+            lines.append("=" * 80 + "\n")
+            lines.extend(vector_lines("r", residual, "12.8e"))
+            
+            lines.append(f"\nНорма невязки: {residual_norm:12.8e}\n")
+            
+            if iterations >= max_iter:
+                lines.append(
+                    f"\n⚠ Достигнуто максимальное число итераций ({max_iter})\n")
+            else:
+                lines.append(
+                    f"\n✓ Решение найдено за {iterations} итераций с точностью {epsilon}\n")
+            
+            self.result_text.delete(1.0, tk.END)
+            self.result_text.insert(tk.END, "".join(lines))
+            
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Ошибка при решении СЛАУ:\n{str(e)}")
+
+
+class MainApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Решение СЛАУ")
+        self.root.geometry("950x750")
+        
+        self.default_A = [
+            [-35.15, 2.83, -1.96, 4.69],
+            [7.92, -21.41, 3.24, -8.76],
+            [2.68, 4.75, -18.82, 1.54],
+            [0.93, -3.16, -2.05, -31.11]
+        ]
+        self.default_b = [0.39, 5.12, -2.37, 4.88]
+        
+        self.create_widgets()
+    
+    def create_widgets(self):
+        notebook = ttk.Notebook(self.root)
+        notebook.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        lu_tab = LUTab(notebook, self.default_A.copy(), self.default_b.copy())
+        notebook.add(lu_tab, text="LU-разложение")
+        
+        seidel_tab = SeidelTab(notebook, self.default_A.copy(), self.default_b.copy())
+        notebook.add(seidel_tab, text="Метод Зейделя")
+
+
+def run():
+    root = tk.Tk()
+    app = MainApp(root)
+    close_on_delete(root)
+    root.mainloop()
@@ -0,0 +1,50 @@
+"""Кусочно-линейная интерполяция без графического интерфейса"""
+
+import numpy as np
+
+
+class SolverCancelled(Exception):
+    """Вычисление остановлено пользователем"""
+
+
+class PiecewiseLinearInterpolation:
+    def __init__(self, x_points, y_points, progress=None):
+        self.x_points = np.array(x_points)
+        self.y_points = np.array(y_points)
+        self.segments = []
+        self.calculate_segments(progress)
+    
+    def calculate_segments(self, progress=None):
+        self.segments = []
+        for i in range(len(self.x_points) - 1):
+            if progress:
+                progress(i, len(self.x_points) - 1)
+            
+            x1, x2 = self.x_points[i], self.x_points[i + 1]
+            y1, y2 = self.y_points[i], self.y_points[i + 1]
+            
+            k = (y2 - y1) / (x2 - x1) if x2 != x1 else 0
+            b = y1 - k * x1
+            
+            self.segments.append({
+                'interval': (x1, x2),
+                'k': k,
+                'b': b,
+                'equation': f'y = {k:.6f}x + {b:.6f}'
+            })
+    
+    def interpolate(self, x):
+        if x < self.x_points[0] or x > self.x_points[-1]:
+            raise ValueError("Точка вне диапазона интерполяции")
+        
+        for i, segment in enumerate(self.segments):
+            x1, x2 = segment['interval']
+            if x1 <= x <= x2:
+                return segment['k'] * x + segment['b']
+        
+        return None
+    
+    def get_segment_by_index(self, index):
+        if 0 <= index < len(self.segments):
+            return self.segments[index]
+        return None
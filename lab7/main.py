@@ -1,7 +1,5 @@
 import numpy as np
 import math
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
 
 
 def f(x):
@@ -43,6 +41,10 @@ def solve(a, b):
     # --------------------------------------------------
     # 5. Построение графика функции на интервале
     # --------------------------------------------------
+    # matplotlib загружается здесь, после расчета интегралов: import main его не требует
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Rectangle
+
     X = np.linspace(a, b, 500)
     Y = f(X)
 
@@ -69,4 +71,5 @@ def solve(a, b):
 # --------------------------------------------------
 # Запуск программы
 # --------------------------------------------------
-solve(-4, 4)
+if __name__ == "__main__":
+    solve(-4, 4)
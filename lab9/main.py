@@ -79,12 +79,17 @@ def newton_method(x0, eps=1e-6, max_iter=50):
     return x, max_iter, F(x), vec_norm(F(x))
 
 
-x0 = [0.5, 0.5]
+def main():
+    x0 = [0.5, 0.5]
 
-x_star, k, F_val, eps_val = newton_method(x0)
+    x_star, k, F_val, eps_val = newton_method(x0)
 
-print("\n===== РЕЗУЛЬТАТЫ РАБОТЫ ПРОГРАММЫ =====")
-print(f"Решение x^(k) = [{x_star[0]:.8f}, {x_star[1]:.8f}]")
-print(f"Количество итераций k = {k}")
-print(f"Вектор F(x^(k)) = [{F_val[0]:.8e}, {F_val[1]:.8e}]")
-print(f"Точность ε = {eps_val:.8e}")
+    print("\n===== РЕЗУЛЬТАТЫ РАБОТЫ ПРОГРАММЫ =====")
+    print(f"Решение x^(k) = [{x_star[0]:.8f}, {x_star[1]:.8f}]")
+    print(f"Количество итераций k = {k}")
+    print(f"Вектор F(x^(k)) = [{F_val[0]:.8e}, {F_val[1]:.8e}]")
+    print(f"Точность ε = {eps_val:.8e}")
+
+
+if __name__ == "__main__":
+    main()